@@ -13,19 +13,30 @@
 # limitations under the License.
 
 import base64
-import datetime
 import errno
-import json
 import os
 import random
+import secrets
 import stat
-import tempfile
 import threading
+import time
 import warnings
+import weakref
 from hashlib import sha1
 
 from earthdaily.earthone.exceptions import AuthError, OauthError
 
+try:
+    # Use the faster orjson when available
+    import orjson
+    from orjson import loads as _json_loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:
+    from json import dumps as _json_dumps, loads as _json_loads
+
 try:
     # public client
     from ..core.common.http import Retry, Session
@@ -49,25 +60,39 @@ class ThreadLocalWrapper(object):
 
     def __init__(self, factory):
         self._factory = factory
-        self._create_local(os.getpid())
+        self._local = None  # Created on first use
+        _thread_local_wrappers.add(self)
 
     def get(self):
-        self._init_local()
-        if not hasattr(self._local, "wrapped"):
-            self._local.wrapped = self._factory()
-        return self._local.wrapped
+        try:
+            return self._local.wrapped
+        except AttributeError:
+            local = self._local
+
+            if local is None:
+                with _thread_local_lock:
+                    if self._local is None:
+                        self._local = threading.local()
+
+                    local = self._local
 
-    def _init_local(self):
-        local_pid = os.getpid()
-        previous_pid = getattr(self._local, "_pid", None)
-        if previous_pid is None:
-            self._local._pid = local_pid
-        elif local_pid != previous_pid:
-            self._create_local(local_pid)
+            wrapped = local.wrapped = self._factory()
+            return wrapped
 
-    def _create_local(self, pid):
-        self._local = threading.local()
-        self._local._pid = pid
+
+# All live wrappers, so their thread-locals can be reset in a forked child process
+# instead of checking the pid on every access.
+_thread_local_wrappers = weakref.WeakSet()
+_thread_local_lock = threading.Lock()
+
+
+def _reset_thread_local_wrappers():
+    for wrapper in list(_thread_local_wrappers):
+        wrapper._local = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_thread_local_wrappers)
 
 
 DEFAULT_TOKEN_INFO_DIR = os.path.join(os.path.expanduser("~"), ".earthone")
@@ -81,6 +106,17 @@ EARTHONE_TOKEN = "EARTHONE_TOKEN"
 EARTHONE_TOKEN_INFO_PATH = "EARTHONE_TOKEN_INFO_PATH"
 
 EARTHONE_CUSTOM_CLAIM_PREFIX = "earthdaily__dl__"
+_CUSTOM_CLAIM_PREFIX_LEN = len(EARTHONE_CUSTOM_CLAIM_PREFIX)
+
+# Seconds to wait after a failed background refresh before trying another one
+_REFRESH_RETRY_DELAY = 60
+
+_TEMP_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_NOFOLLOW", 0)
+
+# Parsed token info files by path, stamped with the modification time and size of the
+# file at the time it was read so changes by other processes are picked up.
+_token_info_cache = {}
+_token_info_lock = threading.Lock()
 
 
 def base64url_decode(input):
@@ -91,13 +127,28 @@ def base64url_decode(input):
     input : str
         A base64url_encoded string to decode.
     """
-    rem = len(input) % 4
-    if rem > 0:
-        input += b"=" * (4 - rem)
+    pad = -len(input) & 3
+    if pad:
+        input += b"=" * pad
 
     return base64.urlsafe_b64decode(input)
 
 
+def _refresh_in_background(auth_ref):
+    # Only hold a weak reference so that a pending refresh doesn't keep an otherwise
+    # unused `Auth` instance alive until its token expires.
+    auth = auth_ref()
+
+    if auth is not None:
+        try:
+            auth._refresh_token()
+        except Exception:
+            # Ignore; `Auth.token` will retry in the foreground once the token
+            # actually expires and report the error at that point. Until then no
+            # new background refresh is started for a while.
+            auth._refresh_failed = time.monotonic()
+
+
 def makedirs_if_not_exists(path):
     if not os.path.exists(path):
         try:
@@ -110,34 +161,61 @@ def makedirs_if_not_exists(path):
                 raise
 
 
+_peek_settings = None
+
+
+def _get_peek_settings():
+    # The config is imported lazily, and only once
+    global _peek_settings
+
+    if _peek_settings is None:
+        from earthdaily.earthone.config import peek_settings
+
+        _peek_settings = peek_settings
+
+    return _peek_settings
+
+
 def get_default_domain():
     # See if we know the environment we're in, and if so use the
     # correct `iam_url`. Use a default if we don't know the environment
-    from earthdaily.earthone.config import peek_settings
-
-    class DummyAuth:
-        payload = {}
-
-    return peek_settings().iam_url
+    return _get_peek_settings()().iam_url
 
 
 def get_app_domain():
-    from earthdaily.earthone.config import peek_settings
+    return _get_peek_settings()().app_url
 
-    class DummyAuth:
-        payload = {}
 
-    return peek_settings().app_url
+_RETRY_ALLOWED_METHODS = frozenset(["GET", "POST"])
+_RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
 
 
 class Auth:
     """Client used to authenticate with all EarthOne service APIs."""
 
-    RETRY_CONFIG = Retry(
-        total=5,
-        backoff_factor=random.uniform(1, 10),
-        allowed_methods=frozenset(["GET", "POST"]),
-        status_forcelist=[429, 500, 502, 503, 504],
+    __slots__ = (
+        "domain",
+        "scope",
+        "leeway",
+        "token_info_path",
+        "client_id",
+        "client_secret",
+        "refresh_token",
+        "_token",
+        "_namespace",
+        "_retry_config",
+        "_session",
+        "_token_payload_cache",
+        "_refresh_lock",
+        "_refresh_timer",
+        "_refresh_failed",
+        # Caches, see the KEY_* names below
+        "_payload",
+        "_aas",
+        "_aasas",
+        "_aoas",
+        "_aoasas",
+        "__weakref__",
     )
 
     AUTHORIZATION_ERROR = (
@@ -169,19 +247,35 @@ class Auth:
     ORG_ADMIN_SUFFIX = ":org-admin"
     RESOURCE_ADMIN_SUFFIX = ":resource-admin"
 
-    # These are cache keys for caching various data in the object's __dict__.
+    # These are the slots for caching various data in the object.
     # These are scrubbed out with `_clear_cache()` when retrieving a new token.
+    # Note that `functools.cached_property` can't be used for these because it
+    # requires an instance `__dict__`, which `Auth` doesn't have.
     KEY_PAYLOAD = "_payload"
     KEY_ALL_ACL_SUBJECTS = "_aas"
     KEY_ALL_ACL_SUBJECTS_AS_SET = "_aasas"
     KEY_ALL_OWNER_ACL_SUBJECTS = "_aoas"
     KEY_ALL_OWNER_ACL_SUBJECTS_AS_SET = "_aoasas"
+    _CACHE_KEYS = (
+        KEY_PAYLOAD,
+        KEY_ALL_ACL_SUBJECTS,
+        KEY_ALL_ACL_SUBJECTS_AS_SET,
+        KEY_ALL_OWNER_ACL_SUBJECTS,
+        KEY_ALL_OWNER_ACL_SUBJECTS_AS_SET,
+    )
 
-    __nopickle_attrs__ = ["_session"]
+    __nopickle_attrs__ = [
+        "_session",
+        "_refresh_lock",
+        "_refresh_timer",
+        "_refresh_failed",
+        "__weakref__",
+    ]
 
     _default_token_info_path = object()  # Just any unique object
 
     _instance = None  # the default Auth instance
+    _instance_lock = threading.Lock()
 
     def __init__(
         self,
@@ -255,7 +349,8 @@ class Auth:
         leeway : int, default 500
             The leeway is given in seconds and is used as a safety cushion
             for the expiration. If the expiration falls within the leeway,
-            the JWT access token will be renewed.
+            the JWT access token will be renewed in the background while the
+            current access token remains in use.
         token_info_path : str, default ``~/.earthone/token_info.json``
             Path to a JSON file holding the credentials. If not set and
             credentials are provided through environment variables or through
@@ -349,56 +444,20 @@ class Auth:
 
         token_info = {}
 
-        # First determine if we are getting our info from the args or environment
-        self.client_id = next(
-            (
-                x
-                for x in (
-                    client_id,
-                    os.environ.get(EARTHONE_CLIENT_ID),
-                    os.environ.get("CLIENT_ID"),
-                )
-                if x is not None
-            ),
-            None,
-        )
-
-        self.client_secret = next(
-            (
-                x
-                for x in (
-                    client_secret,
-                    os.environ.get(EARTHONE_CLIENT_SECRET),
-                    os.environ.get("CLIENT_SECRET"),
-                )
-                if x is not None
-            ),
-            None,
-        )
-
-        self.refresh_token = next(
-            (
-                x
-                for x in (
-                    refresh_token,
-                    os.environ.get(EARTHONE_REFRESH_TOKEN),
-                )
-                if x is not None
-            ),
-            None,
+        # First determine if we are getting our info from the args or environment.
+        # Empty values are never valid, so they are treated the same as missing ones.
+        env = os.environ
+        self.client_id = (
+            client_id or env.get(EARTHONE_CLIENT_ID) or env.get("CLIENT_ID") or None
         )
-
-        self._token = next(
-            (
-                x
-                for x in (
-                    jwt_token,
-                    os.environ.get(EARTHONE_TOKEN),
-                )
-                if x is not None
-            ),
-            None,
+        self.client_secret = (
+            client_secret
+            or env.get(EARTHONE_CLIENT_SECRET)
+            or env.get("CLIENT_SECRET")
+            or None
         )
+        self.refresh_token = refresh_token or env.get(EARTHONE_REFRESH_TOKEN) or None
+        self._token = jwt_token or env.get(EARTHONE_TOKEN) or None
 
         # Make sure self.refresh_token is set
         if not self.refresh_token:
@@ -494,9 +553,18 @@ class Auth:
             warnings.warn(self.AUTHORIZATION_ERROR.format(""), stacklevel=2)
 
         self._namespace = None
+        self._payload = None
+        self._aas = None
+        self._aasas = None
+        self._aoas = None
+        self._aoasas = None
+        self._token_payload_cache = (None, None, 0)
+        self._refresh_lock = threading.Lock()
+        self._refresh_timer = None
+        self._refresh_failed = None
 
         if retries is None:
-            retries = self.RETRY_CONFIG
+            retries = self._default_retry()
 
         self._retry_config = retries
         self._init_session()
@@ -518,23 +586,28 @@ class Auth:
         """
         return Auth(**kwargs)
 
+    @classmethod
+    def _default_retry(cls):
+        # The backoff is randomized for every instance to spread out retries
+        return Retry(
+            total=5,
+            backoff_factor=random.uniform(1, 10),
+            allowed_methods=_RETRY_ALLOWED_METHODS,
+            status_forcelist=_RETRY_STATUS_FORCELIST,
+        )
+
     def _init_session(self):
         # Sessions can't be shared across threads or processes because the underlying
         # SSL connection pool can't be shared. We create them thread-local to avoid
         # intractable exceptions when users naively share clients e.g. when using
-        # multiprocessing.
-        self._session = ThreadLocalWrapper(self.build_session)
+        # multiprocessing. The wrapper itself is only created once a session is needed.
+        self._session = None
 
     def _token_expired(self, payload, leeway=0):
         exp = payload.get("exp")
 
         if exp is not None:
-            now = (
-                datetime.datetime.now(datetime.timezone.utc)
-                - datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
-            ).total_seconds()
-
-            return now + leeway > exp
+            return time.time() + leeway > exp
 
         return True  # Must have exp
 
@@ -554,18 +627,29 @@ class Auth:
         OauthError
             Raised when a token cannot be obtained or refreshed.
         """
-        if self._token is None:
-            self._get_token()
-        else:  # might have token but could be close to expiration
-            payload = self._get_payload(self._token)
-
-            if self._token_expired(payload, self.leeway):
-                try:
-                    self._get_token()
-                except AuthError as e:
-                    # Unable to refresh, raise if truly expired
-                    if self._token_expired(payload):
-                        raise e
+        token = self._token
+
+        if token is None:
+            self._refresh_token()
+            return self._token
+
+        # Only decode the token when it changed, otherwise use the cached expiration
+        cached_token, _, exp = self._token_payload_cache
+
+        if cached_token is not token:
+            self._token_payload(token)
+            _, _, exp = self._token_payload_cache
+
+        now = time.time()
+
+        if now + self.leeway > exp:
+            if now > exp:
+                # Truly expired, we have to wait for a new token
+                self._refresh_token()
+            else:
+                # Within the leeway, refresh in the background and keep using the
+                # current token in the meantime
+                self._schedule_refresh()
 
         return self._token
 
@@ -598,20 +682,78 @@ class Auth:
         OauthError
             Raised when a token cannot be obtained or refreshed.
         """
-        payload = self.__dict__.get(self.KEY_PAYLOAD)
+        payload = self._payload
 
         if payload is None:
-            payload = self._get_payload(self.token)
+            # doctor custom claims; this builds a new dict so the cached token
+            # payload is left untouched. A custom claim wins over a plain claim
+            # of the same name.
+            token_payload = self._token_payload(self.token)
+            payload = {
+                key: value
+                for key, value in token_payload.items()
+                if not key.startswith(EARTHONE_CUSTOM_CLAIM_PREFIX)
+            }
+            payload.update(
+                (key[_CUSTOM_CLAIM_PREFIX_LEN:], value)
+                for key, value in token_payload.items()
+                if key.startswith(EARTHONE_CUSTOM_CLAIM_PREFIX)
+            )
+
+            self._payload = payload
+
+        return payload
 
-            # doctor custom claims
-            if EARTHONE_CUSTOM_CLAIM_PREFIX:
-                for key in list(payload.keys()):
-                    if key.startswith(EARTHONE_CUSTOM_CLAIM_PREFIX):
-                        payload[key[len(EARTHONE_CUSTOM_CLAIM_PREFIX) :]] = payload.pop(
-                            key
-                        )
+    def _refresh_token(self):
+        # Only a single thread retrieves a new token at any time. Any threads that
+        # had to wait for the lock reuse the token that was just retrieved instead of
+        # requesting yet another one.
+        token = self._token
 
-            self.__dict__[self.KEY_PAYLOAD] = payload
+        with self._refresh_lock:
+            if self._token is token:
+                self._get_token()
+
+    def _schedule_refresh(self):
+        """Refresh the token in the background.
+
+        Nothing is started if the token cannot be refreshed, if a background
+        refresh is already pending, or if the last one failed recently.
+        """
+        if not (self.client_id and self.refresh_token):
+            return  # No way to refresh
+
+        timer = self._refresh_timer
+
+        if timer is not None and timer.is_alive():
+            return
+
+        failed = self._refresh_failed
+
+        if failed is not None and time.monotonic() - failed < _REFRESH_RETRY_DELAY:
+            return
+
+        timer = threading.Timer(0, _refresh_in_background, (weakref.ref(self),))
+        timer.daemon = True
+        self._refresh_timer = timer
+        timer.start()
+
+    def _cancel_refresh(self):
+        timer = self._refresh_timer
+
+        if timer is not None:
+            timer.cancel()
+            self._refresh_timer = None
+
+    def _token_payload(self, token):
+        # Decoding the token is relatively expensive, so the payload of the last
+        # decoded token is cached; the cache is keyed on the token itself.
+        cached_token, payload, _ = self._token_payload_cache
+
+        if cached_token is not token or payload is None:
+            payload = self._get_payload(token)
+            # A missing expiration is treated as expired
+            self._token_payload_cache = (token, payload, payload.get("exp") or 0)
 
         return payload
 
@@ -622,14 +764,21 @@ class Auth:
 
         try:
             # Anything that goes wrong here means it's a bad token
-            claims = token.split(b".")[1]
-            return json.loads(base64url_decode(claims).decode("utf-8"))
+            start = token.index(b".") + 1
+            end = token.find(b".", start)
+            claims = token[start:end] if end >= 0 else token[start:]
+            return _json_loads(base64url_decode(claims))
         except Exception as e:
             raise AuthError("Unable to read token {}: {}".format(token, e))
 
     @property
     def session(self):
-        return self._session.get()
+        wrapper = self._session
+
+        if wrapper is None:
+            wrapper = self._session = ThreadLocalWrapper(self.build_session)
+
+        return wrapper.get()
 
     def build_session(self):
         session = Session(self.domain, retries=self._retry_config)
@@ -638,17 +787,23 @@ class Auth:
             session.verify = False
         return session
 
-    @staticmethod
-    def get_default_auth():
+    @classmethod
+    def get_default_auth(cls):
         """Retrieve the default Auth.
 
         This Auth is used whenever you don't explicitly set the Auth
         when creating clients, etc.
         """
-        if Auth._instance is None:
-            Auth._instance = Auth()
+        auth = Auth._instance
+
+        if auth is None:
+            with Auth._instance_lock:
+                auth = Auth._instance
+
+                if auth is None:
+                    auth = Auth._instance = cls()
 
-        return Auth._instance
+        return auth
 
     @staticmethod
     def set_default_auth(auth):
@@ -657,7 +812,11 @@ class Auth:
         This is the Auth that will be used whenever you don't explicitly set the
         Auth when creating clients, etc.
         """
-        Auth._instance = auth
+        with Auth._instance_lock:
+            if Auth._instance is not None and Auth._instance is not auth:
+                Auth._instance._cancel_refresh()
+
+            Auth._instance = auth
 
     @staticmethod
     def _read_token_info(path, suppress_warning=False):
@@ -665,8 +824,19 @@ class Auth:
             return {}
 
         try:
-            with open(path) as fp:
-                return json.load(fp)
+            with _token_info_lock:
+                st = os.stat(path)
+                stamp = (st.st_mtime_ns, st.st_size)
+                cached = _token_info_cache.get(path)
+
+                if cached is None or cached[0] != stamp:
+                    with open(path, "rb") as fp:
+                        cached = (stamp, _json_loads(fp.read()))
+
+                    _token_info_cache[path] = cached
+
+            # Callers are free to modify the returned token info
+            return dict(cached[1])
         except Exception as e:
             if not suppress_warning:
                 warnings.warn(
@@ -694,29 +864,42 @@ class Auth:
                 if isinstance(token, bytes):
                     token_info[Auth.KEY_JWT_TOKEN] = token.decode("utf-8")
 
-            makedirs_if_not_exists(token_info_directory)
-            fd, temp_path = tempfile.mkstemp(
-                prefix=temp_prefix, dir=token_info_directory
-            )
-
             if JWT_TOKEN_PREFIX in path:
                 token_info = {Auth.KEY_JWT_TOKEN: token_info[Auth.KEY_JWT_TOKEN]}
                 suppress_warning = True
 
+            content = _json_dumps(token_info)
+
+            # Skip the write altogether if the file is already up to date
             try:
-                with os.fdopen(fd, "w+") as fp:
-                    json.dump(token_info, fp)
-            finally:
-                fd = None  # Closed now
+                with open(path) as fp:
+                    if fp.read() == content:
+                        return
+            except OSError:
+                pass
 
-            os.chmod(temp_path, stat.S_IRUSR | stat.S_IWUSR)
+            with _token_info_lock:
+                _token_info_cache.pop(path, None)
 
-            try:
-                os.rename(temp_path, path)
-            except FileExistsError:
-                # On windows remove the file first
-                os.remove(path)
-                os.rename(temp_path, path)
+            makedirs_if_not_exists(token_info_directory)
+
+            # Create the temporary file with owner-only permissions in a single call,
+            # refusing to follow a symlink planted in its place
+            new_path = os.path.join(
+                token_info_directory, temp_prefix + secrets.token_hex(6)
+            )
+            fd = os.open(new_path, _TEMP_FILE_FLAGS, stat.S_IRUSR | stat.S_IWUSR)
+            temp_path = new_path
+
+            data = content.encode("utf-8")
+
+            while data:
+                data = data[os.write(fd, data) :]
+
+            os.close(fd)
+            fd = None  # Closed now
+
+            os.replace(temp_path, path)
         except Exception as e:
             if not suppress_warning:
                 warnings.warn(
@@ -818,31 +1001,19 @@ class Auth:
         A list of all ACL subjects identifying this user (the user itself, the org, the
         groups) which can be used in ACL queries.
         """
-        subjects = self.__dict__.get(self.KEY_ALL_ACL_SUBJECTS)
+        subjects = self._aas
 
         if subjects is None:
-            subjects = [self.ACL_PREFIX_USER + self.namespace]
-
-            if email := self.payload.get("email"):
-                subjects.append(self.ACL_PREFIX_EMAIL + email.lower())
-
-            if org := self.payload.get("org"):
-                subjects.append(self.ACL_PREFIX_ORG + org)
-
-            subjects += [
-                self.ACL_PREFIX_GROUP + group for group in self._active_groups()
-            ]
-            self.__dict__[self.KEY_ALL_ACL_SUBJECTS] = subjects
+            subjects, _ = self._cache_acl_subjects()
 
         return subjects
 
     @property
     def all_acl_subjects_as_set(self):
-        subjects_as_set = self.__dict__.get(self.KEY_ALL_ACL_SUBJECTS_AS_SET)
+        subjects_as_set = self._aasas
 
         if subjects_as_set is None:
-            subjects_as_set = set(self.all_acl_subjects)
-            self.__dict__[self.KEY_ALL_ACL_SUBJECTS_AS_SET] = subjects_as_set
+            _, subjects_as_set = self._cache_acl_subjects()
 
         return subjects_as_set
 
@@ -852,52 +1023,88 @@ class Auth:
         A list of ACL subjects identifying this user (the user itself, the org,
         org admin and catalog admins) which can be used in owner ACL queries.
         """
-        subjects = self.__dict__.get(self.KEY_ALL_OWNER_ACL_SUBJECTS)
+        subjects = self._aoas
 
         if subjects is None:
-            subjects = [self.ACL_PREFIX_USER + self.namespace]
-
-            subjects.extend(
-                [self.ACL_PREFIX_ORG + org for org in self.get_org_admins() if org]
-            )
-            subjects.extend(
-                [
-                    self.ACL_PREFIX_ACCESS + access_id
-                    for access_id in self.get_resource_admins()
-                    if access_id
-                ]
-            )
-            self.__dict__[self.KEY_ALL_OWNER_ACL_SUBJECTS] = subjects
+            subjects, _ = self._cache_owner_acl_subjects()
 
         return subjects
 
     @property
     def all_owner_acl_subjects_as_set(self):
-        subjects_as_set = self.__dict__.get(self.KEY_ALL_OWNER_ACL_SUBJECTS_AS_SET)
+        subjects_as_set = self._aoasas
 
         if subjects_as_set is None:
-            subjects_as_set = set(self.all_owner_acl_subjects)
-            self.__dict__[self.KEY_ALL_OWNER_ACL_SUBJECTS_AS_SET] = subjects_as_set
+            _, subjects_as_set = self._cache_owner_acl_subjects()
 
         return subjects_as_set
 
+    def _cache_acl_subjects(self):
+        # Both the list and the set are cached together, whichever is asked for first
+        payload = self.payload
+        group_prefix = self.ACL_PREFIX_GROUP
+        subjects = [f"{self.ACL_PREFIX_USER}{self.namespace}"]
+
+        if email := payload.get("email"):
+            subjects.append(f"{self.ACL_PREFIX_EMAIL}{email.lower()}")
+
+        if org := payload.get("org"):
+            subjects.append(f"{self.ACL_PREFIX_ORG}{org}")
+
+        subjects += [f"{group_prefix}{group}" for group in self._active_groups()]
+        subjects_as_set = set(subjects)
+
+        self._aas = subjects
+        self._aasas = subjects_as_set
+        return subjects, subjects_as_set
+
+    def _cache_owner_acl_subjects(self):
+        # Both the list and the set are cached together, whichever is asked for first
+        org_prefix = self.ACL_PREFIX_ORG
+        access_prefix = self.ACL_PREFIX_ACCESS
+        org_admins, resource_admins = self._classify_admin_groups()
+
+        subjects = [
+            f"{self.ACL_PREFIX_USER}{self.namespace}",
+            *(f"{org_prefix}{org}" for org in org_admins if org),
+            *(
+                f"{access_prefix}{access_id}"
+                for access_id in resource_admins
+                if access_id
+            ),
+        ]
+        subjects_as_set = set(subjects)
+
+        self._aoas = subjects
+        self._aoasas = subjects_as_set
+        return subjects, subjects_as_set
+
     def get_org_admins(self):
         # This retrieves the value of the org to be added if the user has one or
         # more org-admin groups, otherwise the empty list.
-        return [
-            group[: -len(self.ORG_ADMIN_SUFFIX)]
-            for group in self.payload.get("groups", [])
-            if group.endswith(self.ORG_ADMIN_SUFFIX)
-        ]
+        return self._classify_admin_groups()[0]
 
     def get_resource_admins(self):
         # This retrieves the value of the access-id to be added if the user has one or
         # more resource-admin groups, otherwise the empty list.
-        return [
-            group[: -len(self.RESOURCE_ADMIN_SUFFIX)]
-            for group in self.payload.get("groups", [])
-            if group.endswith(self.RESOURCE_ADMIN_SUFFIX)
-        ]
+        return self._classify_admin_groups()[1]
+
+    def _classify_admin_groups(self):
+        # Find both the org-admin and resource-admin groups in a single pass
+        org_admin_suffix = self.ORG_ADMIN_SUFFIX
+        resource_admin_suffix = self.RESOURCE_ADMIN_SUFFIX
+        org_admin_len = len(org_admin_suffix)
+        resource_admin_len = len(resource_admin_suffix)
+        org_admins = []
+        resource_admins = []
+
+        for group in self.payload.get("groups", ()):
+            if group.endswith(org_admin_suffix):
+                org_admins.append(group[:-org_admin_len])
+            elif group.endswith(resource_admin_suffix):
+                resource_admins.append(group[:-resource_admin_len])
+
+        return org_admins, resource_admins
 
     def _active_groups(self):
         """
@@ -906,38 +1113,42 @@ class Auth:
         user's current org, otherwise the user should not actually have rights with
         this group.
         """
-        org = self.payload.get("org")
-        for group in self.payload.get("groups", []):
-            parts = group.split(":")
+        payload = self.payload
+        org = payload.get("org")
+        groups = payload.get("groups", ())
 
-            if len(parts) == 1:
-                yield group
-            elif org and parts[0] == org:
-                yield group
+        if not org:
+            return [group for group in groups if ":" not in group]
+
+        org_prefix = f"{org}:"
+        return [
+            group
+            for group in groups
+            if ":" not in group or group.startswith(org_prefix)
+        ]
 
     def _clear_cache(self):
-        for key in (
-            self.KEY_PAYLOAD,
-            self.KEY_ALL_ACL_SUBJECTS,
-            self.KEY_ALL_ACL_SUBJECTS_AS_SET,
-            self.KEY_ALL_OWNER_ACL_SUBJECTS,
-            self.KEY_ALL_OWNER_ACL_SUBJECTS_AS_SET,
-        ):
-            if key in self.__dict__:
-                del self.__dict__[key]
+        for key in self._CACHE_KEYS:
+            setattr(self, key, None)
         self._namespace = None
+        self._token_payload_cache = (None, None, 0)
+        self._cancel_refresh()
 
     def __getstate__(self):
+        # Subclasses may still have a __dict__ of their own
         return dict(
             (attr, getattr(self, attr))
-            for attr in self.__dict__
-            if attr not in self.__nopickle_attrs__
+            for attr in (*Auth.__slots__, *getattr(self, "__dict__", ()))
+            if attr not in self.__nopickle_attrs__ and hasattr(self, attr)
         )
 
     def __setstate__(self, state):
         for name, value in state.items():
             setattr(self, name, value)
 
+        self._refresh_lock = threading.Lock()
+        self._refresh_timer = None
+        self._refresh_failed = None
         self._init_session()
 
 
@@ -16,9 +16,13 @@ import base64
 import datetime
 import json
 import os
+import pickle
 import tempfile
+import threading
+import time
 import unittest
 import warnings
+import weakref
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -137,6 +141,47 @@ class TestAuth(unittest.TestCase):
             auth = Auth()
             assert payload == auth.payload
 
+    def test_payload_custom_claim_wins(self):
+        for token_payload in (
+            {"groups": ["plain"], f"{EARTHONE_CUSTOM_CLAIM_PREFIX}groups": ["custom"]},
+            {f"{EARTHONE_CUSTOM_CLAIM_PREFIX}groups": ["custom"], "groups": ["plain"]},
+        ):
+            token = b".".join(
+                [
+                    b"",
+                    base64.urlsafe_b64encode(json.dumps(token_payload).encode("utf-8")),
+                    b"",
+                ]
+            )
+            with patch.object(Auth, "token", new=token):
+                auth = Auth()
+                assert {"groups": ["custom"]} == auth.payload
+
+    def test_token_payload_cached(self):
+        auth = Auth(
+            client_secret="client-secret",
+            client_id="client-id",
+        )
+        token = b".".join(
+            (
+                base64.b64encode(to_bytes(p))
+                for p in ["header", json.dumps(dict(exp=9999999999)), "sig"]
+            )
+        )
+        auth._token = token
+
+        with patch.object(
+            Auth, "_get_payload", side_effect=Auth._get_payload
+        ) as _get_payload:
+            assert auth.token == token
+            assert auth.token == token
+            assert auth.payload["exp"] == 9999999999
+            _get_payload.assert_called_once()
+
+            auth._clear_cache()
+            assert auth.token == token
+            assert _get_payload.call_count == 2
+
     @patch.object(Auth, "payload", new=dict(sub="asdf", userid="1234"))
     def test_get_namespace(self):
         auth = Auth(client_secret="client-secret", client_id="client-id")
@@ -244,8 +289,112 @@ class TestAuth(unittest.TestCase):
         auth._token = token
 
         assert auth.token == token
+        timer = auth._refresh_timer
+        timer.join()
         _get_token.assert_called_once()
 
+        # A failed background refresh is not retried right away
+        assert auth.token == token
+        assert auth._refresh_timer is timer
+        _get_token.assert_called_once()
+
+    def test_token_in_leeway_refreshed(self):
+        auth = Auth(
+            client_secret="client-secret",
+            client_id="client-id",
+        )
+        exp = (
+            datetime.datetime.now(datetime.timezone.utc)
+            - datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+        ).total_seconds() + auth.leeway / 2
+        token = b".".join(
+            (
+                base64.b64encode(to_bytes(p))
+                for p in ["header", json.dumps(dict(exp=exp)), "sig"]
+            )
+        )
+        new_token = b".".join(
+            (
+                base64.b64encode(to_bytes(p))
+                for p in ["header", json.dumps(dict(exp=9999999999)), "sig"]
+            )
+        )
+        auth._token = token
+        refreshed = threading.Event()
+
+        def get_token():
+            refreshed.wait()
+            auth._token = new_token
+
+        with patch.object(Auth, "_get_token", side_effect=get_token) as _get_token:
+            # The current token is used while the refresh runs in the background
+            assert auth.token == token
+            assert auth.token == token
+
+            refreshed.set()
+            auth._refresh_timer.join()
+
+            assert auth.token == new_token
+            _get_token.assert_called_once()
+
+    def test_token_refresh_single_flight(self):
+        auth = Auth(
+            client_secret="client-secret",
+            client_id="client-id",
+        )
+        token = b".".join(
+            (
+                base64.b64encode(to_bytes(p))
+                for p in ["header", json.dumps(dict(exp=9999999999)), "sig"]
+            )
+        )
+
+        def get_token():
+            time.sleep(0.1)
+            auth._token = token
+
+        with patch.object(Auth, "_get_token", side_effect=get_token) as _get_token:
+            threads = [threading.Thread(target=lambda: auth.token) for _ in range(5)]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+            _get_token.assert_called_once()
+            assert auth.token == token
+
+    @responses.activate
+    def test_token_refresh_not_scheduled(self):
+        exp = (
+            datetime.datetime.now(datetime.timezone.utc)
+            - datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+        ).total_seconds() + 1000
+        token = b".".join(
+            (
+                base64.b64encode(to_bytes(p))
+                for p in ["header", json.dumps(dict(exp=exp)), "sig"]
+            )
+        ).decode()
+        responses.add(
+            responses.POST,
+            f"{domain}/token",
+            json=dict(id_token=token),
+            status=200,
+        )
+        auth = Auth(
+            client_secret="client-secret",
+            client_id="client-id",
+            token_info_path=None,
+        )
+        auth._get_token()
+
+        # No refresh is started until the token is used within the leeway
+        assert auth._refresh_timer is None
+        assert auth.token == token
+        assert auth._refresh_timer is None
+
     def test_auth_init_env_vars(self):
         warnings.simplefilter("ignore")
 
@@ -408,6 +557,41 @@ class TestAuth(unittest.TestCase):
             )
             assert a._token == token
 
+    def test_token_info_file_cached(self):
+        with tempfile.NamedTemporaryFile("w", delete=False) as token_info_file:
+            json.dump({"client_id": "foo"}, token_info_file)
+
+        assert Auth._read_token_info(token_info_file.name) == {"client_id": "foo"}
+
+        with patch.object(auth_module, "open", side_effect=OSError) as open_:
+            token_info = Auth._read_token_info(token_info_file.name)
+            assert token_info == {"client_id": "foo"}
+            open_.assert_not_called()
+
+        # The cached copy can't be modified through the returned token info
+        token_info["client_id"] = "bar"
+        assert Auth._read_token_info(token_info_file.name) == {"client_id": "foo"}
+
+        Auth._write_token_info(token_info_file.name, {"client_id": "bar"})
+        assert Auth._read_token_info(token_info_file.name) == {"client_id": "bar"}
+
+    def test_write_token_info_unchanged(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "token_info.json")
+            Auth._write_token_info(path, {"client_id": "foo"})
+            inode = os.stat(path).st_ino
+
+            Auth._write_token_info(path, {"client_id": "foo"})
+            assert os.stat(path).st_ino == inode
+
+            Auth._write_token_info(path, {"client_id": "bar"})
+
+            with open(path) as fp:
+                assert json.load(fp) == {"client_id": "bar"}
+
+            assert os.stat(path).st_mode & 0o777 == 0o600
+            assert os.listdir(directory) == ["token_info.json"]
+
     def test_clear_token_info_file(self):
         token = b".".join(
             (
@@ -477,6 +661,55 @@ class TestAuth(unittest.TestCase):
             )
             assert a._token is None
 
+    def test_slots(self):
+        auth = Auth(token_info_path=None, _suppress_warning=True)
+        assert not hasattr(auth, "__dict__")
+        assert weakref.ref(auth)() is auth
+
+    def test_pickle(self):
+        auth = Auth(
+            client_secret="client-secret",
+            client_id="client-id",
+            token_info_path=None,
+            jwt_token=b".".join(
+                (
+                    base64.b64encode(to_bytes(p))
+                    for p in [
+                        "header",
+                        json.dumps(dict(exp=9999999999, aud="client-id")),
+                        "sig",
+                    ]
+                )
+            ),
+        )
+        auth.payload
+
+        unpickled = pickle.loads(pickle.dumps(auth))
+        assert unpickled.token == auth.token
+        assert unpickled.payload == auth.payload
+        assert unpickled._session is None
+        assert unpickled._refresh_timer is None
+
+    def test_get_default_auth(self):
+        Auth.set_default_auth(None)
+
+        try:
+            with patch.object(Auth, "__init__", return_value=None) as init:
+                threads = [
+                    threading.Thread(target=Auth.get_default_auth) for _ in range(5)
+                ]
+
+                for thread in threads:
+                    thread.start()
+
+                for thread in threads:
+                    thread.join()
+
+                init.assert_called_once()
+                assert Auth.get_default_auth() is Auth._instance
+        finally:
+            Auth._instance = None
+
     def test_domain(self):
         a = Auth()
         assert a.domain == domain
@@ -12,4 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from earthdaily.earthone.core.catalog import *  # noqa F401 F403
+from earthdaily.earthone.core import catalog as _catalog
+from earthdaily.earthone.core.catalog import __all__  # noqa F401
+
+
+def __getattr__(name):
+    # Defer to the lazily imported catalog objects
+    return getattr(_catalog, name)
+
+
+def __dir__():
+    return dir(_catalog)
@@ -14,7 +14,6 @@
 
 import os
 import unittest
-from copy import deepcopy
 from unittest.mock import patch
 
 from earthdaily.earthone.auth import Auth
@@ -28,7 +27,7 @@ class TestSettings(unittest.TestCase):
     def setUpClass(cls):
         # Save settings and environment
         cls.settings = Settings._settings
-        cls.environ = deepcopy(os.environ)
+        cls.environ = dict(os.environ)
 
     def setUp(self):
         # Clear existing settings from test environment
@@ -204,42 +203,48 @@ class VerifyValues(unittest.TestCase):
         },
     }
 
+    # Immutable per-config views, computed once for all the verification tests
+    config_items = {name: tuple(config.items()) for name, config in configs.items()}
+
+    @classmethod
+    def setUpClass(cls):
+        # Peek each configuration once; the tests only read from them
+        cls._peeked = {name: Settings.peek_settings(name) for name in cls.configs}
+
     def test_verify_configs(self):
-        for config_name, config in self.configs.items():
-            settings = Settings.peek_settings(config_name)
+        for config_name, config in self.config_items.items():
+            settings = self._peeked[config_name]
 
-            for key in config.keys():
+            for key, expected in config:
                 assert (
-                    config[key] == settings[key]
-                ), f"{config_name}: {key}: {config[key]} != {settings[key]}"
+                    expected == settings[key]
+                ), f"{config_name}: {key}: {expected} != {settings[key]}"
 
     def test_verify_as_dict(self):
-        for config_name, config in self.configs.items():
-            settings = Settings.peek_settings(config_name)
+        for config_name, config in self.config_items.items():
+            settings = self._peeked[config_name]
             settings = settings.as_dict()
 
-            for key in config.keys():
+            for key, expected in config:
                 assert (
-                    config[key] == settings[key]
-                ), f"{config_name}: {key}: {config[key]} != {settings[key]}"
+                    expected == settings[key]
+                ), f"{config_name}: {key}: {expected} != {settings[key]}"
 
     def test_verify_get(self):
-        for config_name, config in self.configs.items():
-            settings = Settings.peek_settings(config_name)
+        for config_name, config in self.config_items.items():
+            settings = self._peeked[config_name]
 
-            for key in config.keys():
+            for key, expected in config:
                 value = settings.get(key)
 
-                assert (
-                    config[key] == value
-                ), f"{config_name}: {key}: {config[key]} != {value}"
+                assert expected == value, f"{config_name}: {key}: {expected} != {value}"
 
     def test_remaining_keys(self):
-        for config_name, config in self.configs.items():
-            settings = Settings.peek_settings(config_name)
+        for config_name, config in self.config_items.items():
+            settings = self._peeked[config_name]
             settings = settings.as_dict()
 
-            for key in config.keys():
+            for key, _ in config:
                 settings.pop(key)
 
             settings.pop("DEFAULT_DOMAIN", None)
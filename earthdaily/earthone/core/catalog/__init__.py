@@ -17,100 +17,118 @@ The Catalog Service provides access to products, bands, and images
 available from EarthOne.
 """
 
-from .task import TaskState
-from .product import (
-    DeletionTaskStatus,
-    Product,
-    ProductCollection,
-)
-from .band import (
-    Band,
-    BandCollection,
-    BandType,
-    ClassBand,
-    Colormap,
-    DataType,
-    DerivedParamsAttribute,
-    GenericBand,
-    MaskBand,
-    MicrowaveBand,
-    ProcessingLevelsAttribute,
-    ProcessingStepAttribute,
-    SpectralBand,
-)
-from .blob import (
-    Blob,
-    BlobCollection,
-    BlobDeletionTaskStatus,
-    BlobSearch,
-    BlobSummaryResult,
-    StorageType,
-)
-from .event_api_destination import (
-    EventApiDestination,
-    EventApiDestinationCollection,
-    EventApiDestinationSearch,
-    EventConnectionParameter,
-)
-from .event_rule import EventRule, EventRuleCollection, EventRuleSearch, EventRuleTarget
-from .event_schedule import EventSchedule, EventScheduleCollection, EventScheduleSearch
-from .event_subscription import (
-    ComputeFunctionCompletedEventSubscription,
-    EventSubscription,
-    EventSubscriptionCollection,
-    EventSubscriptionComputeTarget,
-    EventSubscriptionSearch,
-    EventSubscriptionSqsTarget,
-    EventSubscriptionTarget,
-    EventType,
-    NewImageEventSubscription,
-    NewStorageEventSubscription,
-    NewVectorEventSubscription,
-    Placeholder,
-    ScheduledEventSubscription,
-)
-from .image import Image, ImageSearch, ImageSummaryResult
-from .image_types import ResampleAlgorithm, DownloadFileFormat
-from .image_upload import (
-    ImageUpload,
-    ImageUploadEvent,
-    ImageUploadEventSeverity,
-    ImageUploadEventType,
-    ImageUploadOptions,
-    ImageUploadStatus,
-    ImageUploadType,
-    OverviewResampler,
-)
-from .image_collection import ImageCollection
-from .search import (
-    AggregateDateField,
-    GeoSearch,
-    Interval,
-    Search,
-    SummarySearchMixin,
-)
-from .catalog_base import (
-    AuthCatalogObject,
-    CatalogClient,
-    CatalogObject,
-    DeletedObjectError,
-    UnsavedObjectError,
-)
-from .named_catalog_base import NamedCatalogObject
-from .attributes import (
-    AttributeValidationError,
-    DocumentState,
-    File,
-    Resolution,
-    ResolutionUnit,
-    StorageState,
-)
+import importlib
 
 from ..common.property_filtering import Properties
 
+# The catalog objects are imported on first use, so importing this package doesn't
+# import all the modules at once (PEP 562).
+_lazy_imports = {
+    "AggregateDateField": ".search",
+    "AttributeValidationError": ".attributes",
+    "AuthCatalogObject": ".catalog_base",
+    "Band": ".band",
+    "BandCollection": ".band",
+    "BandType": ".band",
+    "Blob": ".blob",
+    "BlobCollection": ".blob",
+    "BlobDeletionTaskStatus": ".blob",
+    "BlobSearch": ".blob",
+    "BlobSummaryResult": ".blob",
+    "CatalogClient": ".catalog_base",
+    "CatalogObject": ".catalog_base",
+    "ClassBand": ".band",
+    "Colormap": ".band",
+    "ComputeFunctionCompletedEventSubscription": ".event_subscription",
+    "DataType": ".band",
+    "DeletedObjectError": ".catalog_base",
+    "DeletionTaskStatus": ".product",
+    "DerivedParamsAttribute": ".band",
+    "DocumentState": ".attributes",
+    "DownloadFileFormat": ".image_types",
+    "EventApiDestination": ".event_api_destination",
+    "EventApiDestinationCollection": ".event_api_destination",
+    "EventApiDestinationSearch": ".event_api_destination",
+    "EventConnectionParameter": ".event_api_destination",
+    "EventRule": ".event_rule",
+    "EventRuleCollection": ".event_rule",
+    "EventRuleSearch": ".event_rule",
+    "EventRuleTarget": ".event_rule",
+    "EventSchedule": ".event_schedule",
+    "EventScheduleCollection": ".event_schedule",
+    "EventScheduleSearch": ".event_schedule",
+    "EventSubscription": ".event_subscription",
+    "EventSubscriptionCollection": ".event_subscription",
+    "EventSubscriptionComputeTarget": ".event_subscription",
+    "EventSubscriptionSearch": ".event_subscription",
+    "EventSubscriptionSqsTarget": ".event_subscription",
+    "EventSubscriptionTarget": ".event_subscription",
+    "EventType": ".event_subscription",
+    "File": ".attributes",
+    "GenericBand": ".band",
+    "GeoSearch": ".search",
+    "Image": ".image",
+    "ImageCollection": ".image_collection",
+    "ImageSearch": ".image",
+    "ImageSummaryResult": ".image",
+    "ImageUpload": ".image_upload",
+    "ImageUploadEvent": ".image_upload",
+    "ImageUploadEventSeverity": ".image_upload",
+    "ImageUploadEventType": ".image_upload",
+    "ImageUploadOptions": ".image_upload",
+    "ImageUploadStatus": ".image_upload",
+    "ImageUploadType": ".image_upload",
+    "Interval": ".search",
+    "MaskBand": ".band",
+    "MicrowaveBand": ".band",
+    "NamedCatalogObject": ".named_catalog_base",
+    "NewImageEventSubscription": ".event_subscription",
+    "NewStorageEventSubscription": ".event_subscription",
+    "NewVectorEventSubscription": ".event_subscription",
+    "OverviewResampler": ".image_upload",
+    "Placeholder": ".event_subscription",
+    "ProcessingLevelsAttribute": ".band",
+    "ProcessingStepAttribute": ".band",
+    "Product": ".product",
+    "ProductCollection": ".product",
+    "ResampleAlgorithm": ".image_types",
+    "Resolution": ".attributes",
+    "ResolutionUnit": ".attributes",
+    "ScheduledEventSubscription": ".event_subscription",
+    "Search": ".search",
+    "SpectralBand": ".band",
+    "StorageState": ".attributes",
+    "StorageType": ".blob",
+    "SummarySearchMixin": ".search",
+    "TaskState": ".task",
+    "UnsavedObjectError": ".catalog_base",
+}
+
 properties = Properties()
 
-__all__ = [
+
+def __getattr__(name):
+    module_name = _lazy_imports.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def _import_all():
+    """Import all catalog modules, registering all catalog object classes."""
+    for module_name in set(_lazy_imports.values()):
+        importlib.import_module(module_name, __name__)
+
+
+__all__ = (
     "AggregateDateField",
     "AttributeValidationError",
     "AuthCatalogObject",
@@ -190,4 +208,4 @@ __all__ = [
     "SummarySearchMixin",
     "TaskState",
     "UnsavedObjectError",
-]
+)
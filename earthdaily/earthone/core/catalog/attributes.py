@@ -558,14 +558,50 @@ class CatalogObjectReference(Attribute):
         )
 
 
+class _UnparsedTimestamp(str):
+    """A timestamp from the EarthOne catalog that has not been parsed yet."""
+
+    __slots__ = ()
+
+
 class Timestamp(Attribute):
-    """A datetime backed timestamp.  No validation is done."""
+    """A datetime backed timestamp.  No validation is done.
+
+    Timestamps from the EarthOne catalog are parsed when they are first accessed.
+    """
+
+    def __get__(self, obj, objtype):
+        """Gets the value for this attribute, parsing it if necessary."""
+        value = super(Timestamp, self).__get__(obj, objtype)
+
+        if type(value) is _UnparsedTimestamp:
+            value = self._parse(value)
+            obj._attributes[self._attribute_name] = value
+
+        return value
+
+    def __set__(self, obj, value, validate=True):
+        """Sets the value for this attribute on the given object.
+
+        See :meth:`Attribute.__set__`.
+        """
+        # Make sure a pending value compares correctly with the new value
+        self.__get__(obj, None)
+
+        if not validate and isinstance(value, str):
+            # Parsing is deferred until the value is accessed
+            value = _UnparsedTimestamp(value)
+
+        super(Timestamp, self).__set__(obj, value, validate=validate)
 
     def serialize(self, value, jsonapi_format=False):
         """Serialize a value to a json-serializable type.
 
         See :meth:`Attribute.serialize`.
         """
+        if type(value) is _UnparsedTimestamp:
+            value = self._parse(value)
+
         return serialize_datetime(value)
 
     def deserialize(self, value, validate=True):
@@ -589,13 +625,18 @@ class Timestamp(Attribute):
                 return value.replace(tzinfo=timezone.utc)
             else:
                 return value
+        elif type(value) is _UnparsedTimestamp:
+            return value
         else:
-            try:
-                return parse_iso_datetime(value)
-            except ValueError:
-                # Not sure what's going on, but since this came from the service,
-                # don't raise an exception...
-                return value
+            return self._parse(value)
+
+    def _parse(self, value):
+        try:
+            return parse_iso_datetime(value)
+        except ValueError:
+            # Not sure what's going on, but since this came from the service,
+            # don't raise an exception...
+            return str(value) if type(value) is _UnparsedTimestamp else value
 
 
 class EnumAttribute(Attribute):
@@ -619,6 +660,8 @@ class EnumAttribute(Attribute):
                 "EnumAttribute expects a 'StrEnum' or a 'str' and 'Enum' mixin"
             )
         self._enum_cls = enum
+        # Maps the valid values (and therefore the enum members) onto the plain value
+        self._enum_values = {member.value: member.value for member in enum}
 
     def serialize(self, value, jsonapi_format=False):
         """Serialize a value to a json-serializable type.
@@ -647,6 +690,12 @@ class EnumAttribute(Attribute):
         """
         if validate:
             # Validate that the value is allowed, but don't return the Enum instance
+            try:
+                return self._enum_values[value]
+            except (KeyError, TypeError):
+                pass
+
+            # The enum may still accept it, e.g. through `_missing_`
             try:
                 return self._enum_cls(value).value
             except ValueError as e:
@@ -1026,7 +1075,9 @@ class MappingAttribute(ModelAttribute, AttributeEqualityMixin, metaclass=Attribu
         The representation is broken up over multiple lines for readability.
         """
         sections = ["{}:".format(self.__class__.__name__)]
-        for key, val in sorted(self._attributes.items()):
+        for key in sorted(self._attributes):
+            # Read through the attribute so timestamps are shown parsed
+            val = getattr(self, key)
             val_sections = ["  " + v for v in repr(val).split("\n")]
             val = "\n".join(val_sections).strip() if len(val_sections) > 1 else val
             sections.append("  {}: {}".format(key, val))
@@ -13,10 +13,17 @@
 # limitations under the License.
 
 import io
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from hashlib import md5
+from http import HTTPStatus
 
 from strenum import StrEnum
 
-from earthdaily.earthone.exceptions import NotFoundError
+from earthdaily.earthone.exceptions import ClientError, NotFoundError, ServerError
 
 from ..client.services.service import ThirdPartyService
 from ..common.collection import Collection
@@ -44,6 +51,207 @@ from .task import TaskStatus
 
 properties = Properties()
 
+# Size of the blocks in which an uploaded file is read and sent
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Size of the blocks in which downloaded data is written to a file
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Blobs of at least twice this size are downloaded as parts in parallel
+DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+# Maximum number of parts that are downloaded in parallel
+DOWNLOAD_CONCURRENCY = 4
+# Number of threads shared by all parallel downloads
+DOWNLOAD_THREADS = 16
+# Number of seconds for which the download url of a blob is reused
+DOWNLOAD_URL_TTL = 300
+# Maximum number of blob ids in a single deletion task
+DELETE_BATCH_SIZE = 1000
+# Maximum number of deletion tasks that are created in parallel
+DELETE_CONCURRENCY = 8
+
+
+def _namespace_info(client):
+    # The owner of a namespace is the org, or the user if there is no org.  These
+    # only change with the token payload, so they are cached on the client together
+    # with the default namespace and the required prefix.
+    auth = client.auth
+    payload = auth.payload
+    info = getattr(client, "_blob_namespace_info", None)
+
+    if info is None or info[0] is not payload:
+        org = payload.get("org")
+        namespace = auth.namespace
+
+        if org:
+            info = (payload, org, f"{org}:{namespace}", f"{org}:")
+        else:
+            info = (payload, namespace, namespace, f"{namespace}:")
+
+        client._blob_namespace_info = info
+
+    return info
+
+
+# Parts of parallel downloads run on a shared pool, so its threads and their
+# thread-local sessions (and open connections) are reused across downloads.
+_download_executor = None
+_download_executor_lock = threading.Lock()
+
+
+def _get_download_executor():
+    global _download_executor
+
+    if _download_executor is None:
+        with _download_executor_lock:
+            if _download_executor is None:
+                _download_executor = ThreadPoolExecutor(
+                    max_workers=DOWNLOAD_THREADS, thread_name_prefix="blob-download"
+                )
+
+    return _download_executor
+
+
+def _reset_download_executor():
+    # The pool's threads do not exist in a forked child process
+    global _download_executor, _download_executor_lock
+
+    _download_executor = None
+    _download_executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_download_executor)
+
+
+def _open_binary(file, mode):
+    # Returns the binary file to use for reading ("rb") or writing ("wb") together
+    # with whether it was opened here and must be closed by the caller.
+    if isinstance(file, str):
+        return io.open(file, mode), True
+    elif not isinstance(file, io.IOBase):
+        raise ValueError("Invalid file value: must be string or IOBase")
+    elif file.closed:
+        return io.open(file.name, mode), True
+    elif "b" not in file.mode or not (
+        file.readable() if mode == "rb" else file.writable()
+    ):
+        access = "readable" if mode == "rb" else "writable"
+        raise ValueError(f"Invalid file is open but not {access} or binary mode")
+    else:
+        return file, False
+
+
+def _content_iterator(chunk_size):
+    # Returns a download destination which yields the content in chunks; the
+    # response is closed once the generator is exhausted or closed.
+    def generator(response):
+        with response:
+            yield from response.iter_content(chunk_size)
+
+    return generator
+
+
+def _range_header(range):
+    # Convert a `range` argument into the value of an HTTP Range header
+    if isinstance(range, str):
+        return range
+    elif isinstance(range, (list, tuple)) and range:
+        if isinstance(range[0], (list, tuple)):
+            return "bytes=" + ",".join([_range_spec(r) for r in range])
+        else:
+            return "bytes=" + _range_spec(range)
+    else:
+        raise ValueError("invalid range value")
+
+
+def _range_satisfiable(header, size):
+    # Whether any of the ranges in a Range header value starts within the blob;
+    # suffix ranges (e.g. "bytes=-5") and unrecognized values are assumed to be.
+    for spec in header.partition("=")[2].split(","):
+        start = spec.strip().partition("-")[0]
+        if not start.isdigit() or int(start) < size:
+            return True
+
+    return False
+
+
+def _range_spec(range):
+    if isinstance(range, (list, tuple)) and all(isinstance(x, int) for x in range):
+        if len(range) == 1:
+            # No upper bound; a negative value counts back from the end
+            start = range[0]
+            return f"{start}-" if start >= 0 else str(start)
+        elif len(range) == 2:
+            return f"{range[0]}-{range[1]}"
+
+    raise ValueError("invalid range value")
+
+
+def _file_descriptor(file):
+    # Returns the file descriptor of a seekable file that supports positioned
+    # writes, or None.  Positioned writes to a file in append mode always append.
+    if not hasattr(os, "pwrite") or "a" in getattr(file, "mode", "a"):
+        return None
+
+    try:
+        return file.fileno() if file.seekable() else None
+    except (AttributeError, OSError):
+        return None
+
+
+def _pwrite(fd, data, offset):
+    # os.pwrite may write fewer bytes than requested
+    view = memoryview(data)
+
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+class _UploadBody(object):
+    """Request body that streams a seekable binary file in large chunks.
+
+    Without it the file would be sent in small blocks.  Because the body has a
+    length a ``Content-Length`` header is sent instead of using a chunked transfer
+    encoding, and `seek` and `tell` allow a retried request to rewind the body.
+    The MD5 hash of the content is computed while it is being sent.
+    """
+
+    def __init__(self, file, chunk_size=UPLOAD_CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._start = file.tell()
+        self._length = file.seek(0, io.SEEK_END) - self._start
+        self._md5 = None
+        file.seek(self._start)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        # Every (retried) request iterates the body from its start
+        self._md5 = hasher = md5(usedforsecurity=False)
+        update = hasher.update
+        read = self._file.read
+        chunk_size = self._chunk_size
+
+        while chunk := read(chunk_size):
+            update(chunk)
+            yield chunk
+
+    @property
+    def hash(self):
+        """str or None: The hex MD5 digest of the content, once it has been sent."""
+        return None if self._md5 is None else self._md5.hexdigest()
+
+    def tell(self):
+        return self._file.tell() - self._start
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            offset += self._start
+        return self._file.seek(offset, whence) - self._start
+
 
 class StorageType(StrEnum):
     """The storage type for a blob.
@@ -84,15 +292,23 @@ class BlobSummaryResult(object):
 
     """
 
+    __slots__ = ("count", "bytes", "namespaces", "_interval_start")
+
     def __init__(
         self, count=None, bytes=None, namespaces=None, interval_start=None, **kwargs
     ):
         self.count = count
         self.bytes = bytes
         self.namespaces = namespaces
-        self.interval_start = (
-            parse_iso_datetime(interval_start) if interval_start else None
-        )
+        # parsed on first access
+        self._interval_start = interval_start or None
+
+    @property
+    def interval_start(self):
+        interval_start = self._interval_start
+        if isinstance(interval_start, str):
+            interval_start = self._interval_start = parse_iso_datetime(interval_start)
+        return interval_start
 
     def __repr__(self):
         text = [
@@ -268,23 +484,14 @@ class Blob(AuthCatalogObject):
         """
         if client is None:
             client = CatalogClient.get_default_client()
-        org = client.auth.payload.get("org")
-        namespace = client.auth.namespace
+        _, owner, default_id, prefix = _namespace_info(client)
 
         if not namespace_id:
-            if org:
-                return f"{org}:{namespace}"
-            else:
-                return namespace
-        elif org:
-            if namespace_id == org or namespace_id.startswith(org + ":"):
-                return namespace_id
-            else:
-                return f"{org}:{namespace_id}"
-        elif namespace_id == namespace or namespace_id.startswith(namespace + ":"):
+            return default_id
+        elif namespace_id == owner or namespace_id.startswith(prefix):
             return namespace_id
         else:
-            return f"{namespace}:{namespace_id}"
+            return prefix + namespace_id
 
     @classmethod
     def get(
@@ -344,7 +551,7 @@ class Blob(AuthCatalogObject):
         if (not id and not name) or (id and name):
             raise TypeError("Must specify exactly one of id or name parameters")
         if not id:
-            id = f"{storage_type}/{Blob.namespace_id(namespace)}/{name}"
+            id = "/".join((storage_type, cls.namespace_id(namespace, client), name))
         return super(cls, Blob).get(
             id, client=client, request_params=request_params, headers=headers
         )
@@ -406,8 +613,8 @@ class Blob(AuthCatalogObject):
         if (not id and not name) or (id and name):
             raise TypeError("Must specify exactly one of id or name parameters")
         if not id:
-            namespace = cls.namespace_id(namespace)
-            id = f"{storage_type}/{namespace}/{name}"
+            namespace = cls.namespace_id(namespace, client)
+            id = "/".join((storage_type, namespace, name))
             kwargs["storage_type"] = storage_type
             kwargs["namespace"] = namespace
             kwargs["name"] = name
@@ -498,17 +705,7 @@ class Blob(AuthCatalogObject):
                 )
             )
 
-        if isinstance(file, str):
-            file = io.open(file, "rb")
-            close = True
-        elif isinstance(file, io.IOBase):
-            close = file.closed
-            if close:
-                file = io.open(file.name, "rb")
-            elif not file.readable() or "b" not in file.mode:
-                raise ValueError("Invalid file is open but not readable or binary mode")
-        else:
-            raise ValueError("Invalid file value: must be string or IOBase")
+        file, close = _open_binary(file, "rb")
 
         try:
             return self._do_upload(file, request_params=request_params)
@@ -516,6 +713,59 @@ class Blob(AuthCatalogObject):
             if close:
                 file.close()
 
+    @classmethod
+    def upload_many(cls, blobs, files, max_workers=None):
+        """Uploads many storage blobs from files in parallel.
+
+        Each blob is uploaded from the corresponding file as with :py:meth:`upload`.
+        All blobs must be in the state
+        `~earthdaily.earthone.catalog.DocumentState.UNSAVED`.
+
+        Parameters
+        ----------
+        blobs : list(Blob)
+            The blobs to upload.
+        files : list(str or io.IOBase)
+            The files to upload, one for each blob.  See :py:meth:`upload`.
+        max_workers : int, optional
+            Maximum number of threads to use to upload the blobs in parallel.
+            If None, it defaults to the number of processors on the machine,
+            multiplied by 5.
+
+        Returns
+        -------
+        list(Blob)
+            The uploaded blobs.
+
+        Raises
+        ------
+        ValueError
+            If the number of blobs and files differ.
+        RuntimeError
+            If one or more of the uploads failed; the remaining blobs are uploaded.
+        """
+        blobs = list(blobs)
+        files = list(files)
+
+        if len(blobs) != len(files):
+            raise ValueError("There must be exactly one file for each blob")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(blob.upload, file): blob
+                for blob, file in zip(blobs, files)
+            }
+            exceptions = []
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as ex:
+                    exceptions.append((futures[future].name, ex))
+            if exceptions:
+                raise RuntimeError("One or more uploads failed: {}".format(exceptions))
+
+        return blobs
+
     @check_deleted
     def upload_data(self, data, request_params=None):
         """Uploads storage blob from a bytes or str.
@@ -533,8 +783,10 @@ class Blob(AuthCatalogObject):
 
         Parameters
         ----------
-        data : str or bytes
-            Data to be uploaded. A str will be default encoded to bytes.
+        data : str or bytes-like
+            Data to be uploaded. A str will be default encoded to bytes. Any other
+            contiguous buffer (e.g. ``bytearray``, ``memoryview`` or a numpy array)
+            is uploaded as is, without copying it.
 
         Returns
         -------
@@ -566,7 +818,11 @@ class Blob(AuthCatalogObject):
         if isinstance(data, str):
             data = data.encode()
         elif not isinstance(data, bytes):
-            raise ValueError("Invalid data value: must be string or bytes")
+            try:
+                # A flat byte view has the same length in bytes and in items
+                data = memoryview(data).cast("B")
+            except TypeError:
+                raise ValueError("Invalid data value: must be string or bytes-like")
 
         return self._do_upload(data, request_params=request_params)
 
@@ -594,7 +850,16 @@ class Blob(AuthCatalogObject):
         #     headers["content-md5"] = upload.storage.hash
 
         # do the upload
-        self._url_client.session.put(upload.resumable_url, data=src, headers=headers)
+        hash, size_bytes = self._put_data(
+            upload.resumable_url, src, headers, hash_data=not upload.storage.hash
+        )
+
+        # Fill in the hash and size from the data that was sent, if not given, so
+        # the upload is validated when the blob is saved.
+        if hash is not None and not upload.storage.hash:
+            upload.storage.hash = hash
+        if size_bytes is not None and upload.storage.size_bytes is None:
+            upload.storage.size_bytes = size_bytes
 
         req_params = {"upload_signature": upload.signature}
         if request_params:
@@ -611,8 +876,51 @@ class Blob(AuthCatalogObject):
 
         return self
 
+    def _put_data(self, url, src, headers, hash_data=True):
+        # Sends the data to the upload url and returns its MD5 hash and size, which
+        # are None if unknown. The hash is only computed if `hash_data` is set.
+        put = self._url_client.session.put
+
+        if isinstance(src, io.IOBase) and src.seekable():
+            mapping = None
+
+            if not hash_data:
+                try:
+                    mapping = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    # No file descriptor (e.g. `io.BytesIO`) or an empty file
+                    pass
+
+            if mapping is None:
+                # The hash is computed while the file is sent
+                body = _UploadBody(src)
+                put(url, data=body, headers=headers)
+                return body.hash, len(body)
+
+            # Send the mapped file without copying it into user space buffers
+            with mapping, memoryview(mapping) as view:
+                data = view[src.tell() :]
+
+                try:
+                    put(url, data=data, headers=headers)
+                    size = len(data)
+                finally:
+                    data.release()
+
+            # Leave the file at its end, as if it had been read
+            src.seek(0, io.SEEK_END)
+            return None, size
+
+        put(url, data=src, headers=headers)
+
+        if isinstance(src, (bytes, memoryview)):
+            hash = md5(src, usedforsecurity=False).hexdigest() if hash_data else None
+            return hash, len(src)
+        else:
+            return None, None
+
     @check_deleted
-    def download(self, file, range=None):
+    def download(self, file, range=None, chunk_size=None):
         """Downloads storage blob to a file.
 
         Downloads data from the blob to a file.
@@ -633,6 +941,9 @@ class Blob(AuthCatalogObject):
             (e.g. ``((0, 99), (200-299))``). A list or tuple of one integer implies
             no upper bound; in this case the integer can be negative, indicating the
             count back from the end of the blob.
+        chunk_size : int, optional
+            Size of the blocks in which the data is written to the file. Defaults to
+            ``DOWNLOAD_CHUNK_SIZE`` (8 MiB).
 
         Returns
         -------
@@ -649,18 +960,74 @@ class Blob(AuthCatalogObject):
         if self.state != DocumentState.SAVED:
             raise ValueError("Blob {} has not been saved".format(self.id))
 
-        if isinstance(file, str):
-            file = io.open(file, "wb")
-        elif isinstance(file, io.IOBase):
-            close = file.closed
+        return self._download_to(file, range=range, chunk_size=chunk_size)
+
+    def _download_to(self, file, range=None, chunk_size=None):
+        file, close = _open_binary(file, "wb")
+
+        try:
+            return self._do_download(dest=file, range=range, chunk_size=chunk_size)
+        finally:
             if close:
-                file = io.open(file.name, "wb")
-            elif not file.writable() or "b" not in file.mode:
-                raise ValueError("Invalid file is open but not writable or binary mode")
-        else:
-            raise ValueError("Invalid file value: must be string or IOBase")
+                file.close()
+
+    @classmethod
+    def download_many(cls, ids, files, client=None, max_workers=None):
+        """Downloads many storage blobs to files in parallel.
 
-        return self._do_download(dest=file, range=range)
+        Each blob is downloaded to the corresponding file as with :py:meth:`download`.
+
+        Parameters
+        ----------
+        ids : list(str)
+            The ids of the blobs to download.
+        files : list(str or io.IOBase)
+            Where to write the downloaded blobs, one for each id.  See
+            :py:meth:`download`.
+        client : Client, optional
+            Client instance. If not given, the default client will be used.
+        max_workers : int, optional
+            Maximum number of threads to use to download the blobs in parallel.
+            If None, it defaults to the number of processors on the machine,
+            multiplied by 5.
+
+        Returns
+        -------
+        list(str)
+            The names of the downloaded files, in the same order as ``ids``.
+
+        Raises
+        ------
+        ValueError
+            If the number of ids and files differ.
+        RuntimeError
+            If one or more of the downloads failed; the remaining blobs are downloaded.
+        """
+        ids = list(ids)
+        files = list(files)
+
+        if len(ids) != len(files):
+            raise ValueError("There must be exactly one file for each blob id")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(cls(id=id, client=client)._download_to, file): i
+                for i, (id, file) in enumerate(zip(ids, files))
+            }
+            names = [None] * len(ids)
+            exceptions = []
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    names[index] = future.result()
+                except Exception as ex:
+                    exceptions.append((ids[index], ex))
+            if exceptions:
+                raise RuntimeError(
+                    "One or more downloads failed: {}".format(exceptions)
+                )
+
+        return names
 
     @check_deleted
     def data(self, range=None):
@@ -735,13 +1102,7 @@ class Blob(AuthCatalogObject):
         if self.state != DocumentState.SAVED:
             raise ValueError("Blob {} has not been saved".format(self.id))
 
-        def generator(response):
-            try:
-                yield from response.iter_content(chunk_size)
-            finally:
-                response.close()
-
-        return self._do_download(dest=generator, range=range)
+        return self._do_download(dest=_content_iterator(chunk_size), range=range)
 
     @check_deleted
     def iter_lines(self, decode_unicode=False, delimiter=None):
@@ -785,12 +1146,10 @@ class Blob(AuthCatalogObject):
             if decode_unicode:
                 # response will always claim to be application/octet-stream
                 response.encoding = "utf-8"
-            try:
+            with response:
                 yield from response.iter_lines(
                     decode_unicode=decode_unicode, delimiter=delimiter
                 )
-            finally:
-                response.close()
 
         return self._do_download(dest=generator)
 
@@ -857,20 +1216,60 @@ class Blob(AuthCatalogObject):
         if (not id and not name) or (id and name):
             raise TypeError("Must specify exactly one of id or name parameters")
         if not id:
-            id = f"{storage_type}/{cls.namespace_id(namespace)}/{name}"
+            id = "/".join((storage_type, cls.namespace_id(namespace, client), name))
 
-        dest = None
-        if stream:
+        dest = _content_iterator(chunk_size) if stream else None
 
-            def generator(response):
-                try:
-                    yield from response.iter_content(chunk_size)
-                finally:
-                    response.close()
+        return cls(id=id, client=client)._do_download(dest=dest, range=range)
 
-            dest = generator
+    @classmethod
+    def get_data_many(cls, ids, client=None, max_workers=None):
+        """Downloads the data for many storage blobs in parallel.
 
-        return cls(id=id, client=client)._do_download(dest=dest, range=range)
+        Each blob is downloaded as with :py:meth:`get_data`.
+
+        Parameters
+        ----------
+        ids : list(str)
+            The ids of the blobs to download.
+        client : Client, optional
+            Client instance. If not given, the default client will be used.
+        max_workers : int, optional
+            Maximum number of threads to use to download the blobs in parallel.
+            If None, it defaults to the number of processors on the machine,
+            multiplied by 5.
+
+        Returns
+        -------
+        list(bytes)
+            The data retrieved from each Blob, in the same order as ``ids``.
+
+        Raises
+        ------
+        RuntimeError
+            If one or more of the downloads failed; the remaining blobs are downloaded.
+        """
+        ids = list(ids)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(cls.get_data, id=id, client=client): i
+                for i, id in enumerate(ids)
+            }
+            data = [None] * len(ids)
+            exceptions = []
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    data[index] = future.result()
+                except Exception as ex:
+                    exceptions.append((ids[index], ex))
+            if exceptions:
+                raise RuntimeError(
+                    "One or more downloads failed: {}".format(exceptions)
+                )
+
+        return data
 
     @classmethod
     def delete_many(
@@ -885,6 +1284,9 @@ class Blob(AuthCatalogObject):
 
         All blobs to be deleted must belong to the same purchase.
 
+        Large numbers of blobs are deleted by several deletion tasks, each of
+        which is given at most ``DELETE_BATCH_SIZE`` ids.
+
         Parameters
         ----------
         ids : list(str)
@@ -913,16 +1315,65 @@ class Blob(AuthCatalogObject):
         if client is None:
             client = CatalogClient.get_default_client()
 
-        task_status = BlobDeletionTaskStatus.create(
-            ids=ids, raise_on_missing=raise_on_missing, client=client
-        )
+        ids = list(ids)
+
+        if len(ids) <= DELETE_BATCH_SIZE:
+            task_statuses = [
+                BlobDeletionTaskStatus.create(
+                    ids=ids, raise_on_missing=raise_on_missing, client=client
+                )
+            ]
+        else:
+            # Large deletions are split into several concurrent deletion tasks
+            batches = [
+                ids[start : start + DELETE_BATCH_SIZE]
+                for start in range(0, len(ids), DELETE_BATCH_SIZE)
+            ]
+
+            with ThreadPoolExecutor(
+                max_workers=min(DELETE_CONCURRENCY, len(batches))
+            ) as executor:
+                task_statuses = list(
+                    executor.map(
+                        lambda batch: BlobDeletionTaskStatus.create(
+                            ids=batch, raise_on_missing=raise_on_missing, client=client
+                        ),
+                        batches,
+                    )
+                )
+
+        deleted_ids = []
+        for task_status in task_statuses:
+            if wait_for_completion:
+                task_status.wait_for_completion()
+            deleted_ids.extend(task_status.ids)
 
-        if wait_for_completion:
-            task_status.wait_for_completion()
+        return deleted_ids
 
-        return task_status.ids
+    def _do_download(self, dest=None, range=None, chunk_size=None):
+        if range:
+            range = _range_header(range)
+
+            # Don't ask for a range that the server can only reject
+            if self.size_bytes is not None and not _range_satisfiable(
+                range, self.size_bytes
+            ):
+                raise ValueError(
+                    "Range {} is beyond the end of blob {}".format(range, self.id)
+                )
+
+        # Repeated downloads of the same content reuse the download url for a
+        # while; if it has since expired the download is retried with a new url.
+        # Storage backends report an expired url with various client errors
+        # (400, 401, 403, 410, 412), so any client error invalidates it.
+        cached = getattr(self, "_download_url", None)
+
+        if cached and cached[0] == self.hash and cached[1] > time.monotonic():
+            try:
+                return self._download_from(cached[2], dest, range, chunk_size)
+            except ClientError:
+                self._download_url = None
 
-    def _do_download(self, dest=None, range=None):
         download = BlobDownload.get(id=self.id, client=self._client)
 
         # BlobDownload.get() returns None if the blob does not exist
@@ -930,29 +1381,33 @@ class Blob(AuthCatalogObject):
         if not download:
             raise NotFoundError("Blob {} does not exist".format(self.id))
 
-        headers = {}
+        url = download.resumable_url
+        self._download_url = (self.hash, time.monotonic() + DOWNLOAD_URL_TTL, url)
+
+        return self._download_from(url, dest, range, chunk_size)
+
+    def _download_from(self, url, dest, range, chunk_size):
+        # The stored bytes are requested as is; ranges, sizes and parts all refer
+        # to them, and blob data is typically already compressed.
+        headers = {"accept-encoding": "identity"}
         if self.hash:
             headers["if-match"] = self.hash
         if range:
-            if isinstance(range, str):
-                range_str = range
-            elif isinstance(range, (list, tuple)) and all(
-                map(lambda x: isinstance(x, int), range)
-            ):
-                if len(range) == 1:
-                    range_str = f"bytes={range[0]}"
-                elif len(range) == 2:
-                    range_str = f"bytes={range[0]}-{range[1]}"
-                else:
-                    raise ValueError("invalid range value")
-            else:
-                raise ValueError("invalid range value")
+            headers["range"] = range
+        elif dest is None and self.size_bytes is None:
+            return self._download_unsized(url, headers)
+        elif self.size_bytes and not callable(dest):
+            parts = min(DOWNLOAD_CONCURRENCY, self.size_bytes // DOWNLOAD_PART_SIZE)
 
-            headers["range"] = range_str
+            if parts > 1:
+                if dest is None:
+                    return self._download_parts(url, headers, self.size_bytes, parts)
 
-        r = self._url_client.session.get(
-            download.resumable_url, headers=headers, stream=True
-        )
+                fd = _file_descriptor(dest)
+                if fd is not None:
+                    return self._download_parts_to_file(url, headers, parts, dest, fd)
+
+        r = self._url_client.session.get(url, headers=headers, stream=True)
         r.raise_for_status()
         if callable(dest):
             # generator will close response
@@ -962,12 +1417,148 @@ class Blob(AuthCatalogObject):
                 if dest is None:
                     return r.raw.read()
                 else:
-                    for chunk in r.iter_content(1048576):
+                    for chunk in r.iter_content(chunk_size or DOWNLOAD_CHUNK_SIZE):
                         dest.write(chunk)
                     return dest.name
             finally:
                 r.close()
 
+    def _download_unsized(self, url, headers):
+        # Without a known size the first part is requested on its own; its
+        # Content-Range reveals the size, and the rest of a large blob is then
+        # downloaded in parallel.
+        headers_first = {**headers, "range": f"bytes=0-{DOWNLOAD_PART_SIZE - 1}"}
+
+        try:
+            r = self._url_client.session.get(url, headers=headers_first, stream=True)
+        except ClientError as e:
+            # An empty blob has no satisfiable range
+            if getattr(e, "status", None) == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+                return b""
+            raise
+
+        with r:
+            r.raise_for_status()
+            head = b"".join(r.iter_content(DOWNLOAD_CHUNK_SIZE))
+
+        # Anything but a partial response is the whole blob
+        size = r.headers.get("content-range", "").rpartition("/")[2]
+        if r.status_code != HTTPStatus.PARTIAL_CONTENT or not size.isdigit():
+            return head
+
+        size = int(size)
+        if size <= len(head):
+            return head
+
+        parts = min(DOWNLOAD_CONCURRENCY, (size - len(head)) // DOWNLOAD_PART_SIZE)
+        return self._download_parts(url, headers, size, max(parts, 1), head)
+
+    def _download_parts(self, url, headers, size, parts, head=b""):
+        # Download equally sized ranges of the blob in parallel into a single
+        # buffer, following the given first bytes of the blob (if any)
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        view[: len(head)] = head
+
+        def write(offset, data):
+            view[offset : offset + len(data)] = data
+
+        self._download_ranges(url, headers, len(head), size, parts, write)
+
+        return bytes(buffer)
+
+    def _download_parts_to_file(self, url, headers, parts, dest, fd):
+        # Download equally sized ranges of the blob in parallel, each written
+        # directly at its own position in the file so no writes are serialized.
+        dest.flush()
+        position = dest.tell()
+
+        def write(offset, data):
+            _pwrite(fd, data, position + offset)
+
+        self._download_ranges(url, headers, 0, self.size_bytes, parts, write)
+
+        # Leave the file positioned as if the data had been written sequentially
+        dest.seek(position + self.size_bytes)
+        return dest.name
+
+    def _download_ranges(self, url, headers, start, end, parts, write):
+        size = end - start
+        bounds = [start + size * part // parts for part in range(parts + 1)]
+
+        # The first part is requested before the others are started; a server
+        # that ignores the range answers with the whole blob instead, which is
+        # then written as is.
+        first = self._request_part(url, headers, bounds[0], bounds[1])
+
+        if first.status_code != HTTPStatus.PARTIAL_CONTENT:
+            self._write_part(first, 0, end, write)
+            return
+
+        executor = _get_download_executor()
+        futures = [
+            executor.submit(self._download_part, url, headers, start, end, write)
+            for start, end in zip(bounds[1:], bounds[2:])
+        ]
+
+        try:
+            self._write_part(first, bounds[0], bounds[1], write)
+        finally:
+            # All parts must be done before the destination can be released
+            wait(futures)
+
+        for future in futures:
+            future.result()
+
+    def _request_part(self, url, headers, start, end):
+        # Request the bytes from start up to (not including) end
+        headers = {**headers, "range": f"bytes={start}-{end - 1}"}
+
+        # The url client session is thread-local, so this is safe in a worker thread
+        r = self._url_client.session.get(url, headers=headers, stream=True)
+
+        try:
+            r.raise_for_status()
+        except Exception:
+            r.close()
+            raise
+
+        return r
+
+    def _write_part(self, r, start, end, write):
+        # Pass each chunk of the response to write(offset, chunk), expecting
+        # exactly the bytes from start up to (not including) end
+        offset = start
+
+        try:
+            for chunk in r.iter_content(DOWNLOAD_CHUNK_SIZE):
+                if offset + len(chunk) > end:
+                    break
+                write(offset, chunk)
+                offset += len(chunk)
+        finally:
+            r.close()
+
+        if offset != end:
+            raise ServerError(
+                "Incomplete download of blob {}: bytes {}-{}".format(
+                    self.id, start, end - 1
+                )
+            )
+
+    def _download_part(self, url, headers, start, end, write):
+        r = self._request_part(url, headers, start, end)
+
+        if r.status_code != HTTPStatus.PARTIAL_CONTENT:
+            r.close()
+            raise ServerError(
+                "Incomplete download of blob {}: bytes {}-{}".format(
+                    self.id, start, end - 1
+                )
+            )
+
+        self._write_part(r, start, end, write)
+
     @hybridmethod
     @check_derived
     def delete(cls, id, client=None):
@@ -12,11 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from types import MethodType
 
+try:
+    # Use the faster orjson when available
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+
+    def _response_json(response):
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # orjson is strict about non-standard values like NaN
+            return response.json()
+
+except ImportError:
+    import json
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
+    def _response_json(response):
+        return response.json()
+
+
 from earthdaily.earthone.exceptions import NotFoundError
 
 from ..client.deprecation import deprecate
@@ -35,6 +59,26 @@ from .attributes import (
 from .catalog_client import CatalogClient, HttpRequestMethod
 from .search import Search
 
+# Maximum number of ids requested in a single `get_many` request, and the
+# maximum number of such requests in flight at once.
+GET_MANY_BATCH_SIZE = 1000
+GET_MANY_CONCURRENCY = 8
+
+# Maximum number of deletion requests in flight at once in `delete_many`
+DELETE_MANY_CONCURRENCY = 8
+
+# Session method names for the HTTP methods accepted by `_send_data`
+_SESSION_METHODS = {
+    HttpRequestMethod.DELETE: "delete",
+    HttpRequestMethod.GET: "get",
+    HttpRequestMethod.PATCH: "patch",
+    HttpRequestMethod.POST: "post",
+    HttpRequestMethod.PUT: "put",
+}
+
+# Shared by all unmodified objects; a set is only allocated once an attribute changes
+_UNMODIFIED = frozenset()
+
 
 class DeletedObjectError(Exception):
     """Indicates that an action cannot be performed.
@@ -125,11 +169,37 @@ class CatalogObjectMeta(AttributeMeta):
     def __new__(cls, name, bases, attrs):
         new_cls = super(CatalogObjectMeta, cls).__new__(cls, name, bases, attrs)
 
+        # The query string for the default includes, added to read requests
+        new_cls._default_includes_query = (
+            urllib.parse.urlencode({"include": ",".join(new_cls._default_includes)})
+            if new_cls._default_includes
+            else None
+        )
+
+        # Reference attributes sorted by name, as used for initialization and repr
+        new_cls._reference_attribute_items = tuple(
+            sorted(new_cls._reference_attribute_types.items(), key=lambda item: item[0])
+        )
+
         if new_cls._doc_type:
             new_cls._model_classes_by_type_and_derived_type[
                 (new_cls._doc_type, new_cls._derived_type)
             ] = new_cls
 
+            # Precompute the dispatch entry used when deserializing objects
+            dispatch = new_cls._model_class_dispatch
+            if new_cls._derived_type is None:
+                derived = dispatch.get(new_cls._doc_type, (None, None, {}))[2]
+                dispatch[new_cls._doc_type] = (
+                    new_cls,
+                    new_cls._derived_type_switch,
+                    derived,
+                )
+            else:
+                dispatch.setdefault(new_cls._doc_type, (None, None, {}))[2][
+                    new_cls._derived_type
+                ] = new_cls
+
         return new_cls
 
 
@@ -155,6 +225,9 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
 
     _model_classes_by_type_and_derived_type = {}
 
+    # Maps a type to its model class, derived type switch and derived model classes
+    _model_class_dispatch = {}
+
     # Type returned by collect() on the corresponding Search object
     _collection_type = Collection
 
@@ -192,7 +265,7 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         self._client = kwargs.pop("client", None) or CatalogClient.get_default_client()
 
         self._attributes = {}
-        self._modified = set()
+        self._modified = _UNMODIFIED
         self._deleted = False
 
         self._initialize(
@@ -203,10 +276,6 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
             **kwargs,
         )
 
-    def __del__(self):
-        for attr_type in self._attribute_types.values():
-            attr_type.__delete__(self, validate=False)
-
     def _clear_attributes(self):
         self._mapping_attribute_instances = {}
         self._clear_modified_attributes()
@@ -236,17 +305,16 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         if id:
             self.id = id
 
+        attribute_types = self._attribute_types
         for name, val in kwargs.items():
             # Only silently ignore unknown attributes if data came from service
             attribute_definition = (
-                self._attribute_types.get(name)
-                if saved
-                else self._get_attribute_type(name)
+                attribute_types.get(name) if saved else self._get_attribute_type(name)
             )
             if attribute_definition is not None:
                 attribute_definition.__set__(self, val, validate=not saved)
 
-        for name, t in self._reference_attribute_types.items():
+        for name, t in self._reference_attribute_items:
             id_value = kwargs.get(t.id_field)
             if id_value is not None:
                 object_value = kwargs.get(name)
@@ -279,8 +347,7 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
             "{}: {}\n  id: {}".format(self.__class__.__name__, name, self.id)
         ]
         # related objects and their ids
-        for name in sorted(self._reference_attribute_types):
-            t = self._reference_attribute_types[name]
+        for name, t in self._reference_attribute_items:
             # as a temporary hack for image upload, handle missing image_id field
             sections.append("  {}: {}".format(name, getattr(self, t.id_field, None)))
 
@@ -297,6 +364,9 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         return "\n".join(sections)
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if (
             not isinstance(other, self.__class__)
             or self.id != other.id
@@ -307,10 +377,15 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         return super(CatalogObjectBase, self).__eq__(other)
 
     def __setattr__(self, name, value):
-        if not (name.startswith("_") or isinstance(value, MethodType)):
+        # Known attributes are checked first as they are the most common
+        if not (
+            name in self._attribute_types
+            or name.startswith("_")
+            or isinstance(value, MethodType)
+        ):
             # Make sure it's a proper attribute
             self._get_attribute_type(name)
-        super(CatalogObjectBase, self).__setattr__(name, value)
+        object.__setattr__(self, name, value)
 
     @property
     def is_modified(self):
@@ -333,16 +408,36 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
     @classmethod
     def _get_model_class(cls, serialized_object):
         class_type = serialized_object["type"]
-        klass = cls._model_classes_by_type_and_derived_type.get((class_type, None))
 
-        if klass._derived_type_switch:
-            derived_type = serialized_object["attributes"][klass._derived_type_switch]
-            klass = cls._model_classes_by_type_and_derived_type.get(
-                (class_type, derived_type)
-            )
+        try:
+            klass, switch, derived = cls._model_class_dispatch[class_type]
+        except KeyError:
+            klass = cls._lookup_model_class(class_type, None)
+            if klass is None:
+                return None
+            klass, switch, derived = cls._model_class_dispatch[class_type]
+
+        if switch:
+            return derived.get(serialized_object["attributes"][switch])
 
         return klass
 
+    @classmethod
+    def _lookup_model_class(cls, class_type, derived_type):
+        key = (class_type, derived_type)
+
+        try:
+            return cls._model_classes_by_type_and_derived_type[key]
+        except KeyError:
+            pass
+
+        # The catalog modules are imported lazily, so the model class may not have
+        # been registered yet
+        from . import _import_all
+
+        _import_all()
+        return cls._model_classes_by_type_and_derived_type.get(key)
+
     @classmethod
     def _serialize_filter_attribute(cls, name, value):
         """Serialize a single value for a filter.
@@ -388,9 +483,9 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         return (name, attribute_type.serialize(value))
 
     def _set_modified(self, attr_name, changed=True, validate=True):
-        # Verify it is allowed to to be set
-        attr = self._get_attribute_type(attr_name)
         if validate:
+            # Verify it is allowed to to be set
+            attr = self._get_attribute_type(attr_name)
             if attr._readonly:
                 raise AttributeValidationError(
                     "Can't set '{}' because it is a readonly attribute".format(
@@ -405,16 +500,22 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
                 )
 
         if changed:
-            self._modified.add(attr_name)
+            if self._modified:
+                self._modified.add(attr_name)
+            else:
+                self._modified = {attr_name}
 
     def _serialize(self, attrs, jsonapi_format=False):
+        attributes = self._attributes
+        attribute_types = self._attribute_types
+
         serialized = {}
         for name in attrs:
-            value = self._attributes[name]
-            attribute_type = self._get_attribute_type(name)
+            # Only declared attributes can be present
+            attribute_type = attribute_types[name]
             if attribute_type._serializable:
                 serialized[name] = attribute_type.serialize(
-                    value, jsonapi_format=jsonapi_format
+                    attributes[name], jsonapi_format=jsonapi_format
                 )
 
         return serialized
@@ -440,8 +541,10 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         DeletedObjectError
             If this catalog object was deleted.
         """
-        original_values = dict(self._attributes)
-        original_modified = set(self._modified)
+        # A snapshot is only needed when a failure rolls back the changes
+        if kwargs and not ignore_errors:
+            original_values = dict(self._attributes)
+            original_modified = set(self._modified)
 
         for name, val in kwargs.items():
             try:
@@ -484,7 +587,7 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
             return attributes
 
     def _clear_modified_attributes(self):
-        self._modified = set()
+        self._modified = _UNMODIFIED
 
     @property
     def state(self):
@@ -651,18 +754,34 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         if not isinstance(ids, list) or any(not isinstance(id_, str) for id_ in ids):
             raise TypeError("ids must be a list of strings")
 
-        id_filter = {"name": "id", "op": "eq", "val": ids}
+        def send_batch(batch_ids):
+            id_filter = {"name": "id", "op": "eq", "val": batch_ids}
+            return cls._send_data(
+                method=HttpRequestMethod.PUT,
+                client=client,
+                json={"filter": _json_dumps([id_filter])},
+                request_params=request_params,
+                headers=headers,
+            )
 
-        raw_objects, related_objects = cls._send_data(
-            method=HttpRequestMethod.PUT,
-            client=client,
-            json={"filter": json.dumps([id_filter], separators=(",", ":"))},
-            request_params=request_params,
-            headers=headers,
-        )
+        if len(ids) <= GET_MANY_BATCH_SIZE:
+            results = [send_batch(ids)]
+        else:
+            # Large requests are split into batches which are fetched concurrently
+            client = client or CatalogClient.get_default_client()
+            batches = [
+                ids[i : i + GET_MANY_BATCH_SIZE]
+                for i in range(0, len(ids), GET_MANY_BATCH_SIZE)
+            ]
+            with ThreadPoolExecutor(
+                max_workers=min(GET_MANY_CONCURRENCY, len(batches))
+            ) as executor:
+                results = list(executor.map(send_batch, batches))
 
         if not ignore_missing:
-            received_ids = set(obj["id"] for obj in raw_objects)
+            received_ids = set(
+                obj["id"] for raw_objects, _ in results for obj in raw_objects
+            )
             missing_ids = set(ids) - received_ids
 
             if len(missing_ids) > 0:
@@ -670,19 +789,22 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
                     "Objects not found for ids: {}".format(", ".join(missing_ids))
                 )
 
-        objects = [
-            model_class(
-                id=obj["id"],
-                client=client,
-                _saved=True,
-                _relationships=obj.get("relationships"),
-                _related_objects=related_objects,
-                **obj["attributes"],
-            )
-            for obj in raw_objects
-            for model_class in (cls._get_model_class(obj),)
-            if issubclass(model_class, cls)
-        ]
+        get_model_class = cls._get_model_class
+        objects = []
+        for raw_objects, related_objects in results:
+            for obj in raw_objects:
+                model_class = get_model_class(obj)
+                if model_class is not None and issubclass(model_class, cls):
+                    objects.append(
+                        model_class(
+                            id=obj["id"],
+                            client=client,
+                            _saved=True,
+                            _relationships=obj.get("relationships"),
+                            _related_objects=related_objects,
+                            **obj["attributes"],
+                        )
+                    )
 
         return objects
 
@@ -941,6 +1063,54 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         self._client.session.delete(self._url + "/" + self.id)
         self._deleted = True  # non-200 will raise an exception
 
+    @classmethod
+    @check_derived
+    def delete_many(cls, ids, client=None):
+        """Delete many catalog objects with the given `ids`.
+
+        The objects are deleted with concurrent requests.  Objects that are not found
+        are ignored; compare the given ids with the returned list of deleted ids if
+        you need to know.
+
+        Parameters
+        ----------
+        ids : list(str)
+            The ids of the objects to be deleted.
+        client : CatalogClient, optional
+            A `CatalogClient` instance to use for requests to the EarthOne
+            catalog.  The
+            :py:meth:`~earthdaily.earthone.catalog.CatalogClient.get_default_client` will
+            be used if not set.
+
+        Returns
+        -------
+        list(str)
+            A list of the ids of the objects that were successfully deleted.
+
+        Raises
+        ------
+        ConflictError
+            If any of the objects has related objects (bands, images) that exist.
+        ~earthdaily.earthone.exceptions.ClientError or ~earthdaily.earthone.exceptions.ServerError
+            :ref:`Spurious exception <network_exceptions>` that can occur during a
+            network request.
+        """
+        if client is None:
+            client = CatalogClient.get_default_client()
+
+        ids = list(ids)
+        if not ids:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(DELETE_MANY_CONCURRENCY, len(ids))
+        ) as executor:
+            deleted = list(
+                executor.map(lambda id_: cls.delete(id_, client=client), ids)
+            )
+
+        return [id_ for id_, was_deleted in zip(ids, deleted) if was_deleted]
+
     # This unused method must remain here to support unpickling any
     # pickled objects generated prior to v3.2.0.
     def _instance_delete(self):
@@ -953,7 +1123,7 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         cls, method, id=None, json=None, client=None, request_params=None, headers=None
     ):
         client = client or CatalogClient.get_default_client()
-        session_method = getattr(client.session, method.lower())
+        session_method = getattr(client.session, _SESSION_METHODS[method])
         url = cls._url
 
         query_params = {}
@@ -963,17 +1133,19 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
                 query_params.update(**request_params)
         elif request_params:
             if json:
-                json = dict(**json, **request_params)
+                # The request body takes precedence over any extra parameters
+                json = {**request_params, **json}
             else:
-                json = dict(**request_params)
-
-        if cls._default_includes:
-            query_params["include"] = ",".join(cls._default_includes)
+                json = dict(request_params)
 
         if query_params:
+            if cls._default_includes:
+                query_params["include"] = ",".join(cls._default_includes)
             url += "?" + urllib.parse.urlencode(query_params)
+        elif cls._default_includes_query:
+            url += "?" + cls._default_includes_query
 
-        r = session_method(url, json=json, headers=headers).json()
+        r = _response_json(session_method(url, json=json, headers=headers))
         data = r["data"]
         related_objects = cls._load_related_objects(r, client)
 
@@ -984,16 +1156,17 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         related_objects = {}
         related_objects_serialized = response.get("included")
         if related_objects_serialized:
+            get_model_class = cls._get_model_class
             for serialized in related_objects_serialized:
-                model_class = cls._get_model_class(serialized)
+                model_class = get_model_class(serialized)
                 if model_class:
-                    related = model_class(
-                        id=serialized["id"],
+                    id_ = serialized["id"]
+                    related_objects[(serialized["type"], id_)] = model_class(
+                        id=id_,
                         client=client,
                         _saved=True,
                         **serialized["attributes"],
                     )
-                    related_objects[(serialized["type"], serialized["id"])] = related
 
         return related_objects
 
@@ -1106,9 +1279,9 @@ class AuthCatalogObject(CatalogObject):
         if auth is None:
             auth = self._client.auth
 
-        return "internal:platform-admin" in auth.payload.get("groups", []) or bool(
-            set(self.owners) & auth.all_owner_acl_subjects_as_set
-        )
+        return "internal:platform-admin" in auth.payload.get(
+            "groups", []
+        ) or not auth.all_owner_acl_subjects_as_set.isdisjoint(self.owners)
 
     def user_can_write(self, auth=None):
         """Check if the authenticated user is an owner or a writer and has permissions
@@ -1128,8 +1301,8 @@ class AuthCatalogObject(CatalogObject):
         if auth is None:
             auth = self._client.auth
 
-        return self.user_is_owner(auth) or bool(
-            set(self.writers) & auth.all_acl_subjects_as_set
+        return self.user_is_owner(auth) or not auth.all_acl_subjects_as_set.isdisjoint(
+            self.writers
         )
 
     def user_can_read(self, auth=None):
@@ -1157,5 +1330,5 @@ class AuthCatalogObject(CatalogObject):
         return (
             "internal:platform-ro" in auth.payload.get("groups", [])
             or self.user_can_write(auth)
-            or bool(set(self.readers) & auth.all_acl_subjects_as_set)
+            or not auth.all_acl_subjects_as_set.isdisjoint(self.readers)
         )
@@ -251,6 +251,85 @@ class Product(AuthCatalogObject):
             headers=headers,
         )
 
+    @check_deleted
+    def get_bands(self, names, client=None, request_params=None, headers=None):
+        """Retrieve many bands associated with this product by name.
+
+        The bands are retrieved with as few requests as possible, see
+        :py:meth:`~earthdaily.earthone.catalog.Band.get_many`.
+
+        Parameters
+        ----------
+        names : list(str)
+            The names of the bands to retrieve.
+        client : CatalogClient, optional
+            A `CatalogClient` instance to use for requests to the EarthOne
+            catalog.  The
+            :py:meth:`~earthdaily.earthone.catalog.CatalogClient.get_default_client` will
+            be used if not set.
+        request_params : dict, optional
+            A dictionary of additional parameters to send to the catalog along with
+            the ids of the requested bands.
+        headers : dict, optional
+            A dictionary of header keys and values to be sent with the request.
+
+        Returns
+        -------
+        list(Band or None)
+            Derived classes of `Band` that represent the requested band objects, in
+            the same order as `names`, with ``None`` for any band not found.
+
+        """
+        from .band import Band
+
+        return self._get_named_objects(Band, names, client, request_params, headers)
+
+    @check_deleted
+    def get_images(self, names, client=None, request_params=None, headers=None):
+        """Retrieve many images associated with this product by name.
+
+        The images are retrieved with as few requests as possible, see
+        :py:meth:`~earthdaily.earthone.catalog.Image.get_many`.
+
+        Parameters
+        ----------
+        names : list(str)
+            The names of the images to retrieve.
+        client : CatalogClient, optional
+            A `CatalogClient` instance to use for requests to the EarthOne
+            catalog.  The
+            :py:meth:`~earthdaily.earthone.catalog.CatalogClient.get_default_client` will
+            be used if not set.
+        request_params : dict, optional
+            A dictionary of additional parameters to send to the catalog along with
+            the ids of the requested images.
+        headers : dict, optional
+            A dictionary of header keys and values to be sent with the request.
+
+        Returns
+        -------
+        list(~earthdaily.earthone.catalog.Image or None)
+            The requested images, in the same order as `names`, with ``None`` for
+            any image not found.
+
+        """
+        from .image import Image
+
+        return self._get_named_objects(Image, names, client, request_params, headers)
+
+    def _get_named_objects(self, model_class, names, client, request_params, headers):
+        ids = [self.named_id(name) for name in names]
+        objects = model_class.get_many(
+            ids,
+            ignore_missing=True,
+            client=client,
+            request_params=request_params,
+            headers=headers,
+        )
+        objects_by_id = {obj.id: obj for obj in objects}
+
+        return [objects_by_id.get(id_) for id_ in ids]
+
     @check_deleted
     def delete_related_objects(self):
         """Delete all related bands and images for this product.
@@ -409,17 +488,51 @@ class Product(AuthCatalogObject):
         -------
         >>> product_id = Product.namespace_id("my-product")
         """
+        prefix = cls._namespace_prefix(client)
+        if id_.startswith(prefix):
+            return id_
+
+        return "{}{}".format(prefix, id_)
+
+    @classmethod
+    def namespace_ids(cls, ids, client=None):
+        """Generate fully namespaced ids.
+
+        Same as :py:meth:`namespace_id` but for many ids, looking up the namespace
+        only once.
+
+        Parameters
+        ----------
+        ids : list(str)
+            The unprefixed parts of the ids that you want prefixed.
+        client : CatalogClient, optional
+            A `CatalogClient` instance to use for requests to the EarthOne
+            catalog.  The
+            :py:meth:`~earthdaily.earthone.catalog.CatalogClient.get_default_client` will
+            be used if not set.
+
+        Returns
+        -------
+        list(str)
+            The fully namespaced ids, in the same order.
+
+        Example
+        -------
+        >>> product_ids = Product.namespace_ids(["my-product", "my-other-product"])
+        """
+        prefix = cls._namespace_prefix(client)
+
+        return [id_ if id_.startswith(prefix) else prefix + id_ for id_ in ids]
+
+    @classmethod
+    def _namespace_prefix(cls, client):
         if client is None:
             client = CatalogClient.get_default_client()
         org = client.auth.payload.get("org")
         if org is None:
             org = client.auth.namespace  # defaults to the user namespace
 
-        prefix = "{}:".format(org)
-        if id_.startswith(prefix):
-            return id_
-
-        return "{}{}".format(prefix, id_)
+        return "{}:".format(org)
 
 
 class ProductCollection(Collection):
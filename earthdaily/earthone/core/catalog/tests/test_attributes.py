@@ -123,6 +123,37 @@ class TestAttributes(unittest.TestCase):
         obj.date = None
         assert obj.date is None
 
+    def test_timestamp_parsed_on_access(self):
+        class TimeObj(CatalogObject):
+            date = Timestamp()
+
+        obj = TimeObj(id="test-date", date="2019-06-02T00:00:00.0000Z", _saved=True)
+        assert not isinstance(obj._attributes["date"], datetime)
+        assert obj.serialize()["date"] == "2019-06-02T00:00:00+00:00"
+        assert obj == TimeObj(
+            id="test-date", date=datetime(2019, 6, 2, tzinfo=timezone.utc), _saved=True
+        )
+
+        assert obj.date == datetime(2019, 6, 2, tzinfo=timezone.utc)
+        assert isinstance(obj._attributes["date"], datetime)
+
+        obj.date = datetime(2019, 6, 2, tzinfo=timezone.utc)
+        assert not obj.is_modified
+
+    def test_timestamp_repr_parsed(self):
+        nested = Nested(foo="foo", dt="2019-02-01T00:00:00.0000Z", validate=False)
+        assert not isinstance(nested._attributes["dt"], datetime)
+
+        match_str = """\
+            Nested:
+              dt: 2019-02-01 00:00:00+00:00
+              foo: foo"""
+        assert repr(nested) == textwrap.dedent(match_str)
+        assert nested.serialize(nested) == {
+            "dt": "2019-02-01T00:00:00+00:00",
+            "foo": "foo",
+        }
+
     def test_datetime_invalid(self):
         # This should not raise an exception
         Timestamp(readonly=True).deserialize("123439", validate=False)
@@ -133,6 +164,9 @@ class TestAttributes(unittest.TestCase):
         assert enum_attr.serialize("spectral") == "spectral"
         assert BandType.SPECTRAL == "spectral"
 
+        value = enum_attr.deserialize(BandType.SPECTRAL)
+        assert value == "spectral" and type(value) is str
+
     def test_enum_attribute_invalid(self):
         enum_attr = EnumAttribute(BandType)
         with pytest.raises(ValueError):
@@ -14,8 +14,11 @@
 
 # -*- coding: utf-8 -*-
 import copy
+import hashlib
+import io
 import json
 import os
+import numpy as np
 import pytest
 import responses
 
@@ -23,12 +26,14 @@ import textwrap
 
 import shapely.geometry
 
-from datetime import datetime
-from tempfile import NamedTemporaryFile
-from unittest.mock import patch
+from datetime import datetime, timezone
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from unittest.mock import PropertyMock, patch
 
+from earthdaily.earthone.auth import Auth
 from earthdaily.earthone.exceptions import BadRequestError
 from .base import ClientTestCase
+from .. import blob
 from ..attributes import AttributeValidationError
 from ..blob import Blob, BlobCollection, BlobDeletionTaskStatus, BlobSearch, StorageType
 from ..blob_upload import BlobUpload
@@ -40,7 +45,7 @@ def _namespace_id(namespace_id, client=None):
     return "someorg:test-namespace"
 
 
-def _blob_do_download(_, dest=None, range=None):
+def _blob_do_download(_, dest=None, range=None, chunk_size=None):
     mock_data = b"This is mock download data. It can be any binary data."
 
     if range:
@@ -320,6 +325,12 @@ class TestBlob(ClientTestCase):
         assert b.storage_type == StorageType.DATA
         assert b.tags == ["TESTING BLOB"]
 
+        b = Blob.get(name="test-blob", namespace="ns", client=self.client)
+        assert (
+            responses.calls[1].request.url
+            == self.url + "/storage/data/some-org%3Ans/test-blob"
+        )
+
     @responses.activate
     def test_get_unknown_attribute(self):
         self.mock_response(
@@ -861,6 +872,30 @@ class TestBlob(ClientTestCase):
         assert "data/someorg:test-namespace/test-blob-1" in deleted_blobs
         assert "data/someorg:test-namespace/nonexistent-blob" not in deleted_blobs
 
+    @responses.activate
+    @patch.object(blob, "DELETE_BATCH_SIZE", 2)
+    def test_delete_many_batched(self):
+        def delete_callback(request):
+            ids = json.loads(request.body)["data"]["attributes"]["ids"]
+            body = {
+                "data": {
+                    "attributes": {"status": "RUNNING", "ids": ids},
+                    "id": ids[0],
+                    "type": "storage_delete",
+                }
+            }
+            return (201, {}, json.dumps(body))
+
+        responses.add_callback(
+            responses.POST, self.url + "/storage/delete", callback=delete_callback
+        )
+
+        ids = [f"data/someorg:test-namespace/test-blob-{i}" for i in range(5)]
+        deleted_blobs = Blob.delete_many(ids, client=self.client)
+
+        assert deleted_blobs == ids
+        assert len(responses.calls) == 3
+
     def test_serialize(self):
         u = BlobUpload(
             storage=Blob(
@@ -994,6 +1029,10 @@ class TestBlob(ClientTestCase):
                     with pytest.raises(ValueError):
                         b.download(1)
 
+                    with open(f2.name, "rb") as temp:
+                        with pytest.raises(ValueError):
+                            b.download(temp)
+
                     b._saved = False
                     with pytest.raises(ValueError):
                         b.download("wrong")
@@ -1043,3 +1082,480 @@ class TestBlob(ClientTestCase):
 
             finally:
                 os.unlink(f1.name)
+
+    def _mock_upload_responses(self, data):
+        upload_url = "https://storage.example.com/upload"
+        self.mock_response(
+            responses.POST,
+            {
+                "data": {
+                    "attributes": {
+                        "resumable_url": upload_url,
+                        "signature": "signature",
+                    },
+                    "id": "upload-id",
+                    "type": "storage_upload",
+                }
+            },
+        )
+
+        def put_callback(request):
+            # Consume a streamed body like the transport would
+            body = request.body
+            if isinstance(body, memoryview):
+                body = body.tobytes()
+            elif not isinstance(body, bytes):
+                body = b"".join(body)
+            assert body == data
+            return (200, {}, "")
+
+        responses.add_callback(responses.PUT, upload_url, callback=put_callback)
+        self.mock_response(
+            responses.POST,
+            {
+                "data": {
+                    "attributes": {
+                        "hash": "28495fde1c101c01f2d3ae92d1af85a5",
+                        "name": "test-blob",
+                        "namespace": "someorg:test-namespace",
+                        "size_bytes": len(data),
+                        "storage_state": "available",
+                        "storage_type": "data",
+                    },
+                    "id": "data/someorg:test-namespace/test-blob",
+                    "type": "storage",
+                }
+            },
+        )
+
+    @responses.activate
+    @patch.object(Blob, "namespace_id", _namespace_id)
+    def test_upload(self):
+        data = b"This is mock upload data. It can be any binary data."
+        self._mock_upload_responses(data)
+
+        with NamedTemporaryFile(delete=False) as f:
+            f.write(data)
+
+        try:
+            with open(f.name, "rb") as file:
+                b = Blob(
+                    id="data/someorg:test-namespace/test-blob",
+                    name="test-blob",
+                    client=self.client,
+                )
+                b.upload(file)
+
+                request = responses.calls[1].request
+                assert request.headers["content-length"] == str(len(data))
+                assert file.tell() == len(data)
+        finally:
+            os.unlink(f.name)
+
+        assert b.state == DocumentState.SAVED
+        assert b.size_bytes == len(data)
+        attributes = self.get_request_body(2)["data"]["attributes"]
+        assert attributes["upload_signature"] == "signature"
+        assert attributes["hash"] == hashlib.md5(data).hexdigest()
+        assert attributes["size_bytes"] == len(data)
+
+    @responses.activate
+    @patch.object(Blob, "namespace_id", _namespace_id)
+    def test_upload_hashed(self):
+        data = b"This is mock upload data. It can be any binary data."
+        self._mock_upload_responses(data)
+
+        with NamedTemporaryFile(delete=False) as f:
+            f.write(data)
+
+        try:
+            with open(f.name, "rb") as file:
+                b = Blob(
+                    id="data/someorg:test-namespace/test-blob",
+                    name="test-blob",
+                    hash="given-hash",
+                    client=self.client,
+                )
+                with patch.object(blob, "md5", side_effect=AssertionError):
+                    b.upload(file)
+
+                # The mapped file is sent as is, and the file is left at its end
+                assert isinstance(responses.calls[1].request.body, memoryview)
+                assert file.tell() == len(data)
+        finally:
+            os.unlink(f.name)
+
+        attributes = self.get_request_body(2)["data"]["attributes"]
+        assert attributes["hash"] == "given-hash"
+        assert attributes["size_bytes"] == len(data)
+
+    @responses.activate
+    @patch.object(Blob, "namespace_id", _namespace_id)
+    def test_upload_data(self):
+        data = b"This is mock upload data. It can be any binary data."
+        self._mock_upload_responses(data)
+
+        b = Blob(
+            id="data/someorg:test-namespace/test-blob",
+            name="test-blob",
+            client=self.client,
+        )
+        b.upload_data(data)
+
+        assert responses.calls[1].request.body == data
+        attributes = self.get_request_body(2)["data"]["attributes"]
+        assert attributes["hash"] == hashlib.md5(data).hexdigest()
+        assert attributes["size_bytes"] == len(data)
+        assert b.state == DocumentState.SAVED
+
+    def _mock_download_responses(self, data, ignore_range=False):
+        download_url = "https://storage.example.com/download"
+        self.mock_response(
+            responses.GET,
+            {
+                "data": {
+                    "attributes": {"resumable_url": download_url},
+                    "id": "data/someorg:test-namespace/test-blob",
+                    "type": "storage_download",
+                }
+            },
+        )
+
+        def get_callback(request):
+            range_header = request.headers.get("range")
+            if range_header is None or ignore_range:
+                return (200, {}, data)
+            start, end = map(int, range_header.split("=")[1].split("-"))
+            if start >= len(data):
+                return (416, {}, "")
+            end = min(end, len(data) - 1)
+            headers = {"content-range": f"bytes {start}-{end}/{len(data)}"}
+            return (206, headers, data[start : end + 1])
+
+        responses.add_callback(responses.GET, download_url, callback=get_callback)
+
+    @responses.activate
+    @patch.object(blob, "DOWNLOAD_PART_SIZE", 16)
+    def test_data_parallel(self):
+        data = bytes(range(256))
+        self._mock_download_responses(data)
+
+        b = Blob(
+            id="data/someorg:test-namespace/test-blob",
+            name="test-blob",
+            size_bytes=len(data),
+            _saved=True,
+            client=self.client,
+        )
+
+        result = b.data()
+        assert result == data
+        assert type(result) is bytes
+        ranges = sorted(call.request.headers["range"] for call in responses.calls[1:])
+        assert ranges == [
+            "bytes=0-63",
+            "bytes=128-191",
+            "bytes=192-255",
+            "bytes=64-127",
+        ]
+        for call in responses.calls[1:]:
+            assert call.request.headers["accept-encoding"] == "identity"
+
+    @responses.activate
+    @patch.object(blob, "DOWNLOAD_PART_SIZE", 16)
+    def test_get_data_unsized(self):
+        data = bytes(range(256))
+        self._mock_download_responses(data)
+
+        blob_id = "data/someorg:test-namespace/test-blob"
+        assert Blob.get_data(id=blob_id, client=self.client) == data
+        ranges = [call.request.headers["range"] for call in responses.calls[1:]]
+        assert ranges[0] == "bytes=0-15"
+        assert sorted(ranges[1:]) == [
+            "bytes=136-195",
+            "bytes=16-75",
+            "bytes=196-255",
+            "bytes=76-135",
+        ]
+
+        # Small and empty blobs take a single request
+        for small in (b"small", b""):
+            responses.reset()
+            self._mock_download_responses(small)
+            assert Blob.get_data(id=blob_id, client=self.client) == small
+            assert len(responses.calls) == 2
+
+    @responses.activate
+    @patch.object(blob, "DOWNLOAD_PART_SIZE", 16)
+    def test_download_parallel(self):
+        data = bytes(range(256))
+        self._mock_download_responses(data)
+
+        b = Blob(
+            id="data/someorg:test-namespace/test-blob",
+            name="test-blob",
+            size_bytes=len(data),
+            _saved=True,
+            client=self.client,
+        )
+
+        with NamedTemporaryFile(delete=False) as f:
+            f.close()
+            try:
+                with open(f.name, "wb") as dest:
+                    dest.write(b"head")
+                    assert b.download(dest) == f.name
+                    assert dest.tell() == len(data) + 4
+                    dest.write(b"tail")
+
+                with open(f.name, "rb") as handle:
+                    assert handle.read() == b"head" + data + b"tail"
+            finally:
+                os.unlink(f.name)
+
+        assert len(responses.calls) == 5
+
+    @responses.activate
+    @patch.object(blob, "DOWNLOAD_PART_SIZE", 16)
+    def test_data_range_ignored(self):
+        data = bytes(range(256))
+        self._mock_download_responses(data, ignore_range=True)
+
+        b = Blob(
+            id="data/someorg:test-namespace/test-blob",
+            name="test-blob",
+            size_bytes=len(data),
+            _saved=True,
+            client=self.client,
+        )
+
+        assert b.data() == data
+        assert len(responses.calls) == 2
+
+        with NamedTemporaryFile(delete=False) as f:
+            f.close()
+            try:
+                with open(f.name, "wb") as dest:
+                    dest.write(b"head")
+                    assert b.download(dest) == f.name
+                    assert dest.tell() == len(data) + 4
+
+                with open(f.name, "rb") as handle:
+                    assert handle.read() == b"head" + data
+            finally:
+                os.unlink(f.name)
+
+        # The download url is reused
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_download_url_reused(self):
+        data = b"some data"
+        self._mock_download_responses(data)
+
+        b = Blob(
+            id="data/someorg:test-namespace/test-blob",
+            name="test-blob",
+            _saved=True,
+            client=self.client,
+        )
+
+        assert b"".join(b.iter_data()) == data
+        assert b"".join(b.iter_data()) == data
+        assert len(responses.calls) == 3
+
+        # An expired url is replaced, whatever client error reports it
+        for status in (400, 401, 403, 410, 412):
+            responses.calls.reset()
+            responses.replace(
+                responses.GET, "https://storage.example.com/download", status=status
+            )
+            responses.add(
+                responses.GET, "https://storage.example.com/download", body=data
+            )
+
+            assert b"".join(b.iter_data()) == data
+            assert len(responses.calls) == 3
+
+        responses.calls.reset()
+        with patch.object(blob, "DOWNLOAD_URL_TTL", 0):
+            b._download_url = None
+            assert b"".join(b.iter_data()) == data
+            assert b"".join(b.iter_data()) == data
+            assert len(responses.calls) == 4
+
+    def test_upload_many(self):
+        blobs = [Blob(name=f"test-blob-{i}", client=self.client) for i in range(3)]
+        files = [f"file-{i}" for i in range(3)]
+
+        def upload(blob, file, request_params=None):
+            if file == "file-1":
+                raise ValueError("bad file")
+            blob.description = file
+            return blob
+
+        with patch.object(Blob, "upload", upload):
+            with pytest.raises(RuntimeError, match="test-blob-1"):
+                Blob.upload_many(blobs, files, max_workers=2)
+
+            assert [b.description for b in blobs] == ["file-0", None, "file-2"]
+
+            assert Blob.upload_many(blobs[:1], files[:1]) == blobs[:1]
+
+            with pytest.raises(ValueError):
+                Blob.upload_many(blobs, files[:1])
+
+    def test_get_data_many(self):
+        ids = [f"data/some-org:ns/test-blob-{i}" for i in range(3)]
+
+        def get_data(id=None, client=None):
+            if id == ids[1]:
+                raise ValueError("missing")
+            return id.encode()
+
+        with patch.object(Blob, "get_data", get_data):
+            with pytest.raises(RuntimeError, match="test-blob-1"):
+                Blob.get_data_many(ids, max_workers=2)
+
+            assert Blob.get_data_many([ids[2], ids[0]]) == [
+                ids[2].encode(),
+                ids[0].encode(),
+            ]
+
+    def test_download_many(self):
+        ids = [f"data/some-org:ns/test-blob-{i}" for i in range(3)]
+
+        def do_download(blob, dest=None, range=None, chunk_size=None):
+            if blob.id == ids[1]:
+                raise ValueError("missing")
+            dest.write(blob.id.encode())
+            return dest.name
+
+        with TemporaryDirectory() as tmpdir:
+            files = [os.path.join(tmpdir, f"file-{i}") for i in range(3)]
+
+            with patch.object(Blob, "_do_download", do_download):
+                with pytest.raises(RuntimeError, match="test-blob-1"):
+                    Blob.download_many(ids, files, client=self.client, max_workers=2)
+
+                for i in (0, 2):
+                    with open(files[i], "rb") as f:
+                        assert f.read() == ids[i].encode()
+
+                names = Blob.download_many(ids[::2], files[::2], client=self.client)
+                assert names == files[::2]
+
+                with pytest.raises(ValueError):
+                    Blob.download_many(ids, files[:1], client=self.client)
+
+    def test_namespace_id(self):
+        client = self.client
+
+        assert Blob.namespace_id(None, client=client) == "some-org:1234"
+        assert Blob.namespace_id("some-org", client=client) == "some-org"
+        assert Blob.namespace_id("some-org:ns", client=client) == "some-org:ns"
+        assert Blob.namespace_id("ns", client=client) == "some-org:ns"
+
+        # A new token payload without an org
+        with patch.object(
+            Auth, "payload", new_callable=PropertyMock, return_value={"userid": "1234"}
+        ):
+            assert Blob.namespace_id(None, client=client) == "1234"
+            assert Blob.namespace_id("1234", client=client) == "1234"
+            assert Blob.namespace_id("1234:ns", client=client) == "1234:ns"
+            assert Blob.namespace_id("ns", client=client) == "1234:ns"
+
+    def test_summary_result(self):
+        result = blob.BlobSummaryResult(
+            count=1, bytes=10, interval_start="2023-01-01T00:00:00Z"
+        )
+        assert result.interval_start == datetime(2023, 1, 1, tzinfo=timezone.utc)
+        assert result.interval_start is result.interval_start
+        assert blob.BlobSummaryResult(count=0, bytes=0).interval_start is None
+
+    def test_range_header(self):
+        assert blob._range_header("bytes=0-4") == "bytes=0-4"
+        assert blob._range_header((0, 4)) == "bytes=0-4"
+        assert blob._range_header([49]) == "bytes=49-"
+        assert blob._range_header((-5,)) == "bytes=-5"
+        assert blob._range_header(((0, 99), (200, 299))) == "bytes=0-99,200-299"
+        assert blob._range_header([[0, 99], [-5]]) == "bytes=0-99,-5"
+
+        for value in ((1, "a"), (), (1, 2, 3), ((0, 1), 2), 5):
+            with pytest.raises(ValueError):
+                blob._range_header(value)
+
+    @responses.activate
+    def test_range_beyond_end(self):
+        b = Blob(
+            id="data/someorg:test-namespace/test-blob",
+            name="test-blob",
+            size_bytes=10,
+            _saved=True,
+            client=self.client,
+        )
+
+        assert blob._range_satisfiable("bytes=5-20,10-", 10)
+        assert blob._range_satisfiable("bytes=-20", 10)
+
+        for range in ((10,), (20, 30), "bytes=10-", ((10, 11), (12,))):
+            with pytest.raises(ValueError):
+                b.data(range=range)
+
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_put_data_streamed(self):
+        data = b"This is mock upload data. It can be any binary data."
+        self._mock_upload_responses(data)
+
+        b = Blob(name="test-blob", client=self.client)
+        file = io.BytesIO(b"xx" + data)
+        file.seek(2)
+
+        hash, size_bytes = b._put_data("https://storage.example.com/upload", file, {})
+        assert hash == hashlib.md5(data).hexdigest()
+        assert size_bytes == len(data)
+        assert responses.calls[0].request.headers["content-length"] == str(len(data))
+
+    @responses.activate
+    def test_iter_data(self):
+        data = bytes(range(256))
+        self._mock_download_responses(data)
+
+        b = Blob(
+            id="data/someorg:test-namespace/test-blob",
+            name="test-blob",
+            _saved=True,
+            client=self.client,
+        )
+
+        assert list(b.iter_data(chunk_size=100)) == [
+            data[:100],
+            data[100:200],
+            data[200:],
+        ]
+        assert b"".join(b.iter_data(range=(10, 19))) == data[10:20]
+
+    @responses.activate
+    @patch.object(Blob, "namespace_id", _namespace_id)
+    def test_upload_data_buffer(self):
+        array = np.arange(16, dtype=np.float64)
+        data = array.tobytes()
+        self._mock_upload_responses(data)
+
+        b = Blob(
+            id="data/someorg:test-namespace/test-blob",
+            name="test-blob",
+            client=self.client,
+        )
+        b.upload_data(array)
+
+        request = responses.calls[1].request
+        assert request.headers["content-length"] == str(len(data))
+        attributes = self.get_request_body(2)["data"]["attributes"]
+        assert attributes["hash"] == hashlib.md5(data).hexdigest()
+        assert attributes["size_bytes"] == len(data)
+
+        with pytest.raises(ValueError):
+            Blob(name="test-blob", client=self.client).upload_data(array[::2])
@@ -12,9 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
+import json
+import weakref
+
 import pytest
 import responses
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 
 from earthdaily.earthone.exceptions import (
@@ -36,6 +41,7 @@ from ..catalog_base import (
     DeletedObjectError,
     UnsavedObjectError,
 )
+from .. import catalog_base
 from ..named_catalog_base import NamedCatalogObject
 from .base import ClientTestCase
 
@@ -113,6 +119,14 @@ class TestCatalogObject(ClientTestCase):
         assert c.tags == ["foo", "bar"]
         assert c.is_modified
 
+    def test_released(self):
+        c = CatalogObject(id="id", tags=["foo"])
+        ref = weakref.ref(c)
+
+        del c
+        gc.collect()
+        assert ref() is None
+
     def test_create_non_attr(self):
         with pytest.raises(AttributeError):
             CatalogObject(foo="bad")
@@ -187,6 +201,18 @@ class TestCatalogObject(ClientTestCase):
         foo = Foo.get("foo1")
         assert foo._client is not None
 
+    @responses.activate
+    def test_get_non_standard_json(self):
+        responses.add(
+            responses.GET,
+            self.match_url,
+            body='{"data": {"type": "foo", "id": "foo1", "attributes": {"bar": NaN}}}',
+            content_type="application/json",
+        )
+
+        foo = Foo.get("foo1", client=self.client)
+        assert foo.bar != foo.bar
+
     @responses.activate
     def test_get_on_behalf_of(self):
         self.mock_response(
@@ -282,6 +308,26 @@ class TestCatalogObject(ClientTestCase):
         assert ["baz", "qux"] == [f.bar for f in foos]
         assert responses.calls[1].request.headers["X-On-Behalf-Of"] == "user"
 
+    @responses.activate
+    @patch.object(catalog_base, "GET_MANY_BATCH_SIZE", 2)
+    def test_get_many_batched(self):
+        def callback(request):
+            ids = json.loads(json.loads(request.body)["filter"])[0]["val"]
+            data = [
+                {"attributes": {"bar": id_}, "id": id_, "type": Foo._doc_type}
+                for id_ in ids
+            ]
+            return 200, {}, json.dumps({"data": data, "jsonapi": {"version": "1.0"}})
+
+        responses.add_callback(responses.PUT, self.match_url, callback=callback)
+
+        ids = ["p1:foo{}".format(i) for i in range(5)]
+        foos = Foo.get_many(ids, client=self.client)
+
+        assert len(responses.calls) == 3
+        assert ids == [f.id for f in foos]
+        assert ids == [f.bar for f in foos]
+
     @responses.activate
     def test_reload(self):
         self.mock_response(
@@ -488,6 +534,19 @@ class TestCatalogObject(ClientTestCase):
 
         assert Foo.delete("nerp", client=self.client)
 
+    @responses.activate
+    def test_delete_many(self):
+        def callback(request):
+            if request.url.endswith("/missing"):
+                return 404, {}, json.dumps(self.not_found_json)
+            return 200, {}, json.dumps({"jsonapi": {"version": "1.0"}})
+
+        responses.add_callback(responses.DELETE, self.match_url, callback=callback)
+
+        deleted = Foo.delete_many(["nerp", "missing", "derp"], client=self.client)
+        assert deleted == ["nerp", "derp"]
+        assert len(responses.calls) == 3
+
     @responses.activate
     def test_delete_instancemethod(self):
         self.mock_response(
@@ -704,14 +763,14 @@ class TestAuthCatalogObject(ClientTestCase):
         payload = auth.payload
         auth._clear_cache()
         assert auth._namespace is None
-        assert "_payload" not in auth.__dict__
+        assert auth._payload is None
         payload.update(
             {
                 "sub": "some|other-user",
                 "userid": "4321",
             }
         )
-        auth.__dict__["_payload"] = payload
+        auth._payload = payload
 
         assert not obj.user_is_owner(auth)
         assert obj.user_can_write(auth)
@@ -726,7 +785,7 @@ class TestAuthCatalogObject(ClientTestCase):
                 "userid": "4321",
             }
         )
-        auth.__dict__["_payload"] = payload
+        auth._payload = payload
 
         assert not obj.user_is_owner(auth)
         assert not obj.user_can_write(auth)
@@ -741,7 +800,7 @@ class TestAuthCatalogObject(ClientTestCase):
                 "userid": "4321",
             }
         )
-        auth.__dict__["_payload"] = payload
+        auth._payload = payload
 
         assert not obj.user_is_owner(auth)
         assert not obj.user_can_write(auth)
@@ -547,6 +547,17 @@ class TestProduct(ClientTestCase):
 
         assert Product.namespace_id("foo", client=Client) == "mynamespace:foo"
 
+    def test_namespace_ids(self):
+        class Client(object):
+            class auth(object):
+                namespace = "mynamespace"
+                payload = {"org": "someorg"}
+
+        assert Product.namespace_ids(["foo", "someorg:bar"], client=Client) == [
+            "someorg:foo",
+            "someorg:bar",
+        ]
+
     def test_named_id(self):
         p = Product(id="id1")
         assert p.named_id("band1") == "id1:band1"
@@ -647,6 +658,33 @@ class TestProduct(ClientTestCase):
 
         assert len(w) == 0
 
+    @responses.activate
+    def test_get_bands(self):
+        self.mock_response(
+            responses.PUT,
+            {
+                "data": [
+                    {
+                        "attributes": {
+                            "name": name,
+                            "product_id": "p1",
+                            "type": "spectral",
+                        },
+                        "id": "p1:" + name,
+                        "type": "band",
+                    }
+                    for name in ("b2", "b1")
+                ],
+                "jsonapi": {"version": "1.0"},
+            },
+        )
+
+        p = Product(id="p1", name="Product 1", client=self.client, _saved=True)
+        bands = p.get_bands(["b1", "missing", "b2"], client=self.client)
+
+        assert len(responses.calls) == 1
+        assert [b and b.id for b in bands] == ["p1:b1", None, "p1:b2"]
+
     @responses.activate
     def test_deleted_band_image(self):
         self.mock_response(responses.GET, self.not_found_json, status=404)
@@ -429,7 +429,7 @@ class Session(requests.Session):
             )
         elif resp.status_code < HTTPStatus.INTERNAL_SERVER_ERROR:
             ex = ClientError(resp.text)
-            ex.status = resp.status_code.value
+            ex.status = resp.status_code
             raise ex
         elif resp.status_code == HTTPStatus.GATEWAY_TIMEOUT:
             raise GatewayTimeoutError(
@@ -14,6 +14,7 @@
 
 import os
 import threading
+import weakref
 
 
 class ThreadLocalWrapper(object):
@@ -28,22 +29,36 @@ class ThreadLocalWrapper(object):
 
     def __init__(self, factory):
         self._factory = factory
-        self._create_local(os.getpid())
+        self._local = None  # Created on first use
+        _thread_local_wrappers.add(self)
 
     def get(self):
-        self._init_local()
-        if not hasattr(self._local, "wrapped"):
-            self._local.wrapped = self._factory()
-        return self._local.wrapped
-
-    def _init_local(self):
-        local_pid = os.getpid()
-        previous_pid = getattr(self._local, "_pid", None)
-        if previous_pid is None:
-            self._local._pid = local_pid
-        elif local_pid != previous_pid:
-            self._create_local(local_pid)
-
-    def _create_local(self, pid):
-        self._local = threading.local()
-        self._local._pid = pid
+        try:
+            return self._local.wrapped
+        except AttributeError:
+            local = self._local
+
+            if local is None:
+                with _thread_local_lock:
+                    if self._local is None:
+                        self._local = threading.local()
+
+                    local = self._local
+
+            wrapped = local.wrapped = self._factory()
+            return wrapped
+
+
+# All live wrappers, so their thread-locals can be reset in a forked child process
+# instead of checking the pid on every access.
+_thread_local_wrappers = weakref.WeakSet()
+_thread_local_lock = threading.Lock()
+
+
+def _reset_thread_local_wrappers():
+    for wrapper in list(_thread_local_wrappers):
+        wrapper._local = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_thread_local_wrappers)
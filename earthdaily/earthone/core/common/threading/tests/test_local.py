@@ -37,6 +37,11 @@ class ThreadLocalWrapperTest(unittest.TestCase):
     def _send_id(self, queue):
         queue.put(self.wrapper.get())
 
+    def test_lazy_local(self):
+        assert self.wrapper._local is None
+        self.wrapper.get()
+        assert self.wrapper._local is not None
+
     def test_thread_thread(self):
         main_thread_id = self.wrapper.get()
         assert main_thread_id == self.wrapper.get()
@@ -38,6 +38,42 @@ def make_uuid():
     return str(uuid.uuid4())
 
 
+# Characters that can start a JSON document, other values are plain strings
+_JSON_START = frozenset('{["-0123456789tfnNI \t\n\r')
+
+
+def _request_params(request):
+    """Parse the query parameters of a request, caching them on the request."""
+    try:
+        return request._parsed_params
+    except AttributeError:
+        pass
+
+    request_params = {}
+
+    for key, value in urllib.parse.parse_qsl(urllib.parse.urlsplit(request.url).query):
+        if value[:1] in _JSON_START:
+            try:
+                value = jsonlib.loads(value)
+            except jsonlib.JSONDecodeError:
+                pass
+
+        if key in request_params:
+            values = request_params[key]
+
+            if not isinstance(values, list):
+                values = [values]
+
+            values.append(value)
+        else:
+            values = value
+
+        request_params[key] = values
+
+    request._parsed_params = request_params
+    return request_params
+
+
 class BaseTestCase(TestCase):
     compute_url = get_settings().compute_url
 
@@ -56,6 +92,7 @@ class BaseTestCase(TestCase):
 
         responses.mock.assert_all_requests_are_fired = True
         self.now = datetime.now(timezone.utc).replace(tzinfo=None)
+        self._now_iso = self.now.isoformat()
 
         payload = (
             base64.b64encode(
@@ -119,7 +156,7 @@ class BaseTestCase(TestCase):
             "function_id": make_uuid(),
             "args": None,
             "kwargs": None,
-            "creation_date": self.now.isoformat(),
+            "creation_date": self._now_iso,
             "status": JobStatus.PENDING,
         }
         job.update(data)
@@ -135,7 +172,7 @@ class BaseTestCase(TestCase):
 
         function = {
             "id": make_uuid(),
-            "creation_date": self.now.isoformat(),
+            "creation_date": self._now_iso,
             "status": FunctionStatus.AWAITING_BUNDLE,
         }
         function.update(data)
@@ -167,27 +204,7 @@ class BaseTestCase(TestCase):
                 calls_with_data.append(request.body.decode())
 
             if params is not None:
-                request_params = {}
-
-                for key, value in urllib.parse.parse_qsl(
-                    urllib.parse.urlsplit(request.url).query
-                ):
-                    try:
-                        value = jsonlib.loads(value)
-                    except jsonlib.JSONDecodeError:
-                        value = value
-
-                    if key in request_params:
-                        values = request_params[key]
-
-                        if not isinstance(values, list):
-                            values = [values]
-
-                        values.append(value)
-                    else:
-                        values = value
-
-                    request_params[key] = values
+                request_params = _request_params(request)
 
                 if request_params:
                     calls_with_params.add(jsonlib.dumps(request_params))
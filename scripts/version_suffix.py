@@ -10,6 +10,8 @@ suffix = len(sys.argv) >= 3 and sys.argv[2].strip() or ""
 with open(file_path) as f:
     lines = f.readlines()
 
+changed = False
+
 for i, line in enumerate(lines):
     if line.strip().startswith("__version__"):
         base_version = line.split("=")[1].strip().strip("\"'")
@@ -18,7 +20,10 @@ for i, line in enumerate(lines):
             new_version = f"{base_version}{suffix}"
             print(f"Adding suffix. {new_version=}")
             lines[i] = f'__version__ = "{new_version}"\n'
-            break
+            changed = True
+        break
 
-with open(file_path, "w") as f:
-    f.writelines(lines)
+# Only rewrite the file if the version was changed
+if changed:
+    with open(file_path, "w") as f:
+        f.writelines(lines)